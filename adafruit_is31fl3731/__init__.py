@@ -61,6 +61,7 @@ try:
     # Import ReadableBuffer here
     from typing import (
         TYPE_CHECKING,
+        Callable,
         Iterable,
         List,
         Optional,
@@ -106,6 +107,14 @@ _ENABLE_OFFSET = const(0x00)
 _BLINK_OFFSET = const(0x12)
 _COLOR_OFFSET = const(0x24)
 
+# Unchanged bytes between two changed runs that are cheaper to resend than
+# to start a new write transaction (address, register and start/stop)
+_MERGE_GAP = const(3)
+
+# Blink bits of a whole frame, all on or all off
+_BLINK_ALL = b"\xff" * 18
+_BLINK_NONE = bytes(18)
+
 
 class IS31FL3731:
     """
@@ -115,20 +124,66 @@ class IS31FL3731:
     :param ~busio.I2C i2c: the connected i2c bus i2c_device
     :param int address: the device address; defaults to 0x74
     :param Iterable frames: list of frame indexes to use. int's 0-7.
+    :param bool buffered: if True, `pixel`, `fill` and `image` only update an
+        in-memory copy of the frame; call `show` to send it to the chip.
+    :param bool lazy_init: if True, frames are cleared the first time they
+        are used instead of all at startup.
+    :param bool reinit: if False and the chip is already running, keep its
+        configuration and frames instead of clearing them.
+    :param int max_transfer: the most bytes, register address included, the
+        host can send in one I2C write; longer writes are split. Default
+        no limit (up to 181 bytes are sent at once).
     """
 
     width: int = 16
     height: int = 9
 
-    def __init__(
+    # Pixel to register tables for each board class: one per rotation built
+    # by _addr_table(), then the packed r, g, b table built by _rgb_table()
+    _addr_tables = {}
+
+    def __init__(  # noqa: PLR0913 Too many arguments in function definition
         self,
         i2c: busio.I2C,
         frames: Optional[Iterable] = None,
         address: int = 0x74,
+        buffered: bool = False,
+        lazy_init: bool = False,
+        reinit: bool = True,
+        max_transfer: Optional[int] = None,
     ):
         self.i2c_device = I2CDevice(i2c, address)
+        if max_transfer is not None and max_transfer < 2:
+            raise ValueError("max_transfer must be at least 2")
+        self.max_transfer = max_transfer
         self._frame = None
-        self._init(frames=frames)
+        # Last bank written to the bank address register, None if unknown
+        self._selected_bank = None
+        # Copy of the function registers (_CONFIG_BANK), None until known
+        self._config = None
+        self._buffered = buffered
+        self._buffers = [None] * 8
+        self._flushed = [None] * 8
+        # Blink bits of each frame, with _BLINK_OFFSET in byte 0
+        self._blink_masks = [None] * 8
+        # Bit per frame whose blink mask still has to be sent by show()
+        self._blink_pending = 0
+        # Bit per frame still to be cleared on first use, see lazy_init
+        self._pending_frames = 0
+        # Buffers reused by every write so drawing does not allocate: a
+        # register address and value, a one byte read result, and the blink
+        # and PWM registers of a frame (with _BLINK_OFFSET in byte 0) for
+        # unbuffered writes of a whole frame
+        self._cmd = bytearray(2)
+        self._result = bytearray(1)
+        self._scratch = bytearray(163)
+        self._scratch[0] = _BLINK_OFFSET
+        # Brightness correction table set by set_gamma(), None for none
+        self._gamma = None
+        # Bus statistics, see enable_stats()
+        self._stats = None
+        self._trace = None
+        self._init(frames=frames, lazy=lazy_init, reinit=reinit)
 
     def _i2c_read_reg(
         self, reg: Optional[int] = None, result: Optional[WriteableBuffer] = None
@@ -137,28 +192,79 @@ class IS31FL3731:
         # The provided result parameter will be filled to capacity with bytes
         # of data read from the register.
         with self.i2c_device as i2c:
-            i2c.write_then_readinto(bytes([reg]), result)
+            try:
+                self._cmd[0] = reg
+                i2c.write_then_readinto(self._cmd, result, out_end=1)
+            except OSError:
+                # The chip may have been reset, don't trust the bank cache
+                self._selected_bank = None
+                raise
             return result
         return None
 
-    def _i2c_write_reg(
-        self, reg: Optional[int] = None, data: Optional[ReadableBuffer] = None
-    ) -> None:
-        # Write a contiguous block of data (bytearray) starting at the
-        # specified I2C register address (register passed as argument).
-        self._i2c_write_block(bytes([reg]) + data)
+    def _write_byte(self, reg: int, value: int) -> None:
+        # Write one register through the preallocated command buffer
+        cmd = self._cmd
+        cmd[0] = reg
+        cmd[1] = value
+        self._i2c_write_block(cmd)
 
-    def _i2c_write_block(self, data: Optional[ReadableBuffer]) -> None:
-        # Write a buffer of data (byte array) to the specified I2C register
-        # address.
+    def _i2c_write_block(
+        self, data: Optional[ReadableBuffer], start: int = 0, end: Optional[int] = None
+    ) -> None:
+        # Write data[start:end], register address first, without slicing.
+        # CircuitPython's I2CDevice.write() takes no None for end.
+        if end is None:
+            end = len(data)
         with self.i2c_device as i2c:
-            i2c.write(data)
+            try:
+                i2c.write(data, start=start, end=end)
+            except OSError:
+                self._selected_bank = None
+                raise
+
+    def _timed_read_reg(
+        self, reg: Optional[int] = None, result: Optional[WriteableBuffer] = None
+    ) -> Optional[WriteableBuffer]:
+        # Replaces _i2c_read_reg() while enable_stats() is in effect
+        start = time.monotonic_ns()
+        try:
+            return type(self)._i2c_read_reg(self, reg, result)
+        finally:
+            self._count("read", reg, len(result), time.monotonic_ns() - start)
+
+    def _timed_write_block(
+        self, data: Optional[ReadableBuffer], start: int = 0, end: Optional[int] = None
+    ) -> None:
+        # Replaces _i2c_write_block() while enable_stats() is in effect
+        if end is None:
+            end = len(data)
+        began = time.monotonic_ns()
+        try:
+            type(self)._i2c_write_block(self, data, start, end)
+        finally:
+            self._count("write", data[start], end - start - 1, time.monotonic_ns() - began)
+
+    def _count(self, kind: str, register: int, length: int, elapsed: int) -> None:
+        stats = self._stats
+        stats["transactions"] += 1
+        stats["bytes_" + ("read" if kind == "read" else "written")] += length
+        if kind == "write" and register == _BANK_ADDRESS:
+            stats["bank_switches"] += 1
+        stats["time_ns"] += elapsed
+        if self._trace is not None:
+            self._trace(kind, register, length, elapsed)
 
     def _bank(self, bank: Optional[int] = None) -> Optional[int]:
         if bank is None:
-            result = bytearray(1)
-            return self._i2c_read_reg(_BANK_ADDRESS, result)[0]
-        self._i2c_write_reg(_BANK_ADDRESS, bytearray([bank]))
+            self._selected_bank = self._i2c_read_reg(_BANK_ADDRESS, self._result)[0]
+            return self._selected_bank
+        # Skip the write when the bank is already selected
+        if bank != self._selected_bank:
+            self._write_byte(_BANK_ADDRESS, bank)
+            self._selected_bank = bank
+            if self._pending_frames & 1 << bank:
+                self._clear_frame(bank)
         return None
 
     def _register(
@@ -167,36 +273,238 @@ class IS31FL3731:
         register: Optional[int] = None,
         value: Optional[int] = None,
     ) -> Optional[int]:
+        # Function registers are served from, and compared against, the copy
+        # kept in self._config to avoid needless bus traffic.
+        config = self._config if bank == _CONFIG_BANK else None
+        if config is not None:
+            if value is None:
+                return config[register]
+            if config[register] == value:
+                return None
         self._bank(bank)
         if value is None:
-            result = bytearray(1)
-            return self._i2c_read_reg(register, result)[0]
-        self._i2c_write_reg(register, bytearray([value]))
+            return self._i2c_read_reg(register, self._result)[0]
+        self._write_byte(register, value)
+        if config is not None:
+            config[register] = value
         return None
 
+    def _buffer(self, frame: int) -> bytearray:
+        # Return the in-memory PWM data of a frame, allocated on first use.
+        # Byte 0 holds the register address so the whole buffer can be
+        # written to the chip in a single transaction.
+        buf = self._buffers[frame]
+        if buf is None:
+            buf = bytearray(145)
+            buf[0] = _COLOR_OFFSET
+            self._buffers[frame] = buf
+        return buf
+
+    @staticmethod
+    def _change_start(buf: bytearray, flushed: bytearray, start: int) -> int:
+        # First index from start on where buf differs from flushed, or
+        # len(buf) if there is none
+        for i in range(start, len(buf)):
+            if buf[i] != flushed[i]:
+                return i
+        return len(buf)
+
+    @staticmethod
+    def _change_end(buf: bytearray, flushed: bytearray, start: int) -> int:
+        # End of the run of changes beginning at start, merging runs
+        # separated by no more than _MERGE_GAP unchanged bytes
+        end = start + 1
+        for i in range(end, len(buf)):
+            if i - end > _MERGE_GAP:
+                break
+            if buf[i] != flushed[i]:
+                end = i + 1
+        return end
+
+    def _write_changes(self, buf: bytearray, flushed: bytearray) -> None:
+        # Write the runs of buf that differ from flushed
+        start = self._change_start(buf, flushed, 1)
+        while start < len(buf):
+            end = self._change_end(buf, flushed, start)
+            self._write_run(buf, start, end)
+            start = self._change_start(buf, flushed, end)
+
+    def _write_steps(  # noqa: PLR0913 Too many arguments in function definition
+        self, buf: bytearray, frame: int, start: int, end: int, chunk: Optional[int]
+    ) -> Iterable:
+        # Write buf[start:end] to a frame in pieces of at most chunk bytes
+        # (all at once if None), yielding after each one.  The bank is
+        # selected again before every piece, as other code may select
+        # another one while this is suspended.
+        step = end - start if chunk is None else chunk
+        for piece in range(start, end, step):
+            self._bank(frame)
+            self._write_run(buf, piece, min(piece + step, end))
+            yield
+
+    def _show_steps(self, frame: int, chunk: Optional[int] = None) -> Iterable:
+        # The work of show() for AsyncDisplay, yielding after every write of
+        # at most chunk data bytes so callers can do something else between
+        # them.  show() itself does not use it, to avoid allocating.  As
+        # drawing may go on while suspended, copies of the data are sent and
+        # only what was sent is recorded as flushed.
+        if self._blink_pending & 1 << frame:
+            sent = bytearray(self._blink_masks[frame])
+            yield from self._write_steps(sent, frame, 1, 19, chunk)
+            if self._blink_masks[frame] == sent:
+                self._blink_pending &= ~(1 << frame)
+        buf = self._buffers[frame]
+        if buf is None:
+            return
+        sent = bytearray(buf)
+        flushed = self._flushed[frame]
+        if flushed is None:
+            # Chip contents unknown, send everything once
+            yield from self._write_steps(sent, frame, 1, 145, chunk)
+            self._flushed[frame] = sent
+            return
+        if sent == flushed:
+            return
+        flushed = bytearray(flushed)
+        start = self._change_start(sent, flushed, 1)
+        while start < len(sent):
+            end = self._change_end(sent, flushed, start)
+            yield from self._write_steps(sent, frame, start, end, chunk)
+            start = self._change_start(sent, flushed, end)
+        self._flushed[frame] = sent
+
+    def _write_run(self, buf: bytearray, start: int, end: int) -> None:
+        # Write buf[start:end] to consecutive registers, borrowing the byte
+        # in front of the run for the register address to avoid a copy.
+        # buf[0] holds the register address of buf[1].  The run is split
+        # into writes of at most max_transfer bytes.
+        step = end - start if self.max_transfer is None else self.max_transfer - 1
+        for chunk in range(start, end, step):
+            saved = buf[chunk - 1]
+            buf[chunk - 1] = buf[0] + chunk - 1
+            try:
+                self._i2c_write_block(buf, chunk - 1, min(chunk + step, end))
+            finally:
+                buf[chunk - 1] = saved
+
+    def _blink_mask(self, frame: int) -> bytearray:
+        # Return the blink bits of a frame, reading them from the chip the
+        # first time a frame not initialized by _init() is used.
+        if self._pending_frames & 1 << frame:
+            self._clear_frame(frame)
+        mask = self._blink_masks[frame]
+        if mask is None:
+            mask = bytearray(19)
+            self._bank(frame)
+            self._i2c_read_reg(_BLINK_OFFSET, memoryview(mask)[1:])
+            mask[0] = _BLINK_OFFSET
+            self._blink_masks[frame] = mask
+        return mask
+
+    def _update_blink(self, frame: int) -> None:
+        # Send the blink mask of a frame now, or on the next show() when
+        # buffered, in one write.
+        if self._buffered:
+            self._blink_pending |= 1 << frame
+            return
+        self._bank(frame)
+        self._write_run(self._blink_masks[frame], 1, 19)
+
     def _mode(self, mode: Optional[int] = None) -> int:
         """Function for setting _register mode"""
         return self._register(_CONFIG_BANK, _MODE_REGISTER, mode)
 
-    def _init(self, frames: Iterable) -> None:
+    def _init(self, frames: Iterable, lazy: bool = False, reinit: bool = True) -> None:
+        self._selected_bank = None
+        self._config = None
+        self._pending_frames = 0
+        if not reinit:
+            config = bytearray(13)
+            self._bank(_CONFIG_BANK)
+            self._i2c_read_reg(_MODE_REGISTER, config)
+            if config[_SHUTDOWN_REGISTER]:
+                # Already running (it powers up shut down), keep everything
+                self._config = config
+                self._frame = config[_FRAME_REGISTER]
+                return
         self.sleep(True)
         # Clear config; sets to Picture Mode, no audio sync, maintains sleep
         self._bank(_CONFIG_BANK)
-        self._i2c_write_block(bytes([0] * 14))
-        enable_data = bytes([_ENABLE_OFFSET] + [255] * 18)
-        fill_data = bytearray([0] * 25)
+        self._write_run(bytearray(14), 1, 14)
+        self._config = bytearray(13)  # Registers 0x00-0x0C, as just written
         # Initialize requested frames, or all 8 if unspecified
         for frame in frames if frames else range(8):
-            self._bank(frame)
-            self._i2c_write_block(enable_data)  # Set all enable bits
-            for row in range(6):  # Barebones quick fill() w/0
-                fill_data[0] = _COLOR_OFFSET + row * 24
-                self._i2c_write_block(fill_data)
+            if lazy:
+                self._pending_frames |= 1 << frame
+            else:
+                self._clear_frame(frame)
         self._frame = 0  # To match config bytes above
         self.sleep(False)
 
+    def _clear_frame(self, frame: int) -> None:
+        # Set all enable bits and clear all blink and PWM registers of a
+        # frame in one write.
+        self._pending_frames &= ~(1 << frame)
+        try:
+            self._bank(frame)
+            self._write_run(bytearray([_ENABLE_OFFSET] + [255] * 18 + [0] * 162), 1, 181)
+        except OSError:
+            self._pending_frames |= 1 << frame
+            raise
+        if self._blink_masks[frame] is None:
+            mask = bytearray(19)
+            mask[0] = _BLINK_OFFSET
+            self._blink_masks[frame] = mask
+
+    def enable_stats(self, callback: Optional[Callable] = None) -> None:
+        """
+        Start counting I2C transactions, bytes, bank switches and the time
+        they take.  There is no overhead until this is called.
+
+        :param callback: optional function called after every transaction
+            with the kind (``"read"`` or ``"write"``), the first register,
+            the number of data bytes and the time taken in nanoseconds
+        """
+        if self._stats is None:
+            self.reset_stats()
+        self._trace = callback
+        # Route the bus access of this instance through the counting versions
+        self._i2c_read_reg = self._timed_read_reg
+        self._i2c_write_block = self._timed_write_block
+
+    def disable_stats(self) -> None:
+        """Stop counting; the counts so far stay available in `stats`"""
+        try:
+            del self._i2c_read_reg
+            del self._i2c_write_block
+        except AttributeError:
+            pass  # Not enabled
+        self._trace = None
+
+    @property
+    def stats(self) -> dict:
+        """
+        Counts since `enable_stats` or `reset_stats`: ``transactions``,
+        ``bytes_written`` (not counting the register address),
+        ``bytes_read``, ``bank_switches`` and ``time_ns`` spent on the bus
+        """
+        if self._stats is None:
+            self.reset_stats()
+        return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        """Set all the counts in `stats` to 0"""
+        self._stats = {
+            "transactions": 0,
+            "bytes_written": 0,
+            "bytes_read": 0,
+            "bank_switches": 0,
+            "time_ns": 0,
+        }
+
     def reset(self) -> None:
         """Kill the display for 10MS"""
+        self._selected_bank = None
         self.sleep(True)
         time.sleep(0.01)  # 10 MS pause to reset.
         self.sleep(False)
@@ -232,10 +540,41 @@ class IS31FL3731:
             raise ValueError("Frames out of range")
         if not 1 <= delay <= 64:
             raise ValueError("Delay out of range")
+        for frame in range(8):  # Don't play frames left uncleared by lazy_init
+            if self._pending_frames & 1 << frame:
+                self._clear_frame(frame)
         self._register(_CONFIG_BANK, _AUTOPLAY1_REGISTER, loops << 4 | frames)
         self._register(_CONFIG_BANK, _AUTOPLAY2_REGISTER, delay % 64)
         self._mode(_AUTOPLAY_MODE | self._frame)
 
+    def upload_animation(self, frames: Iterable, delay: int, loops: int = 0) -> None:
+        """
+        Load up to 8 frames into the chip and play them with `autoplay`, so
+        the animation runs with no further bus traffic.  Everything is
+        checked before anything is sent; each frame is then sent in a
+        single write.
+
+        :param frames: 1 to 8 images, each anything `image` accepts
+        :param delay: time each frame is shown in ms, 11->704
+        :param loops: number of loops - 1->7, 0 to loop forever
+        """
+        frames = list(frames)
+        if not 1 <= len(frames) <= 8:
+            raise ValueError("Frames must be 1 to 8 images")
+        if not 0 <= loops <= 7:
+            raise ValueError("Loops out of range")
+        if not 1 <= delay // 11 <= 64:
+            raise ValueError("Delay out of range")
+        for img in frames:
+            self._check_image(img)
+        self.autoplay(0)  # Hold still while the frames change
+        for number, img in enumerate(frames):
+            self.image(img, frame=number)
+            if self._buffered:
+                self.show(number)
+        self.frame(0, show=False)  # Autoplay starts from the current frame
+        self.autoplay(delay, loops, len(frames) % 8)  # 0 plays all 8
+
     def fade(
         self,
         fade_in: Optional[int] = None,
@@ -284,13 +623,45 @@ class IS31FL3731:
         """
         if frame is None:
             return self._frame
-        if not 0 <= frame <= 8:
+        if not 0 <= frame <= 7:
             raise ValueError("Frame out of range")
         self._frame = frame
         if show:
+            if self._pending_frames & 1 << frame:
+                self._clear_frame(frame)
             self._register(_CONFIG_BANK, _FRAME_REGISTER, frame)
         return None
 
+    def show(self, frame: Optional[int] = None) -> None:
+        """
+        Send the buffered PWM data of a frame to the chip.  Only needed when
+        the display was created with ``buffered=True``.  Only the registers
+        changed since the last call are sent.
+
+        :param frame: int the frame to send, default the current frame
+        """
+        if frame is None:
+            frame = self._frame
+        if self._blink_pending & 1 << frame:
+            self._bank(frame)
+            self._write_run(self._blink_masks[frame], 1, 19)
+            self._blink_pending &= ~(1 << frame)
+        buf = self._buffers[frame]
+        if buf is None:
+            return
+        flushed = self._flushed[frame]
+        if flushed is None:
+            # Chip contents unknown, send everything once
+            self._bank(frame)
+            self._write_run(buf, 1, 145)
+            self._flushed[frame] = bytearray(buf)
+            return
+        if buf == flushed:
+            return
+        self._bank(frame)
+        self._write_changes(buf, flushed)
+        flushed[:] = buf
+
     def audio_sync(self, value: Optional[int]) -> Optional[int]:
         """Set the audio sync feature register"""
         return self._register(_CONFIG_BANK, _AUDIOSYNC_REGISTER, value)
@@ -332,6 +703,40 @@ class IS31FL3731:
         self._register(_CONFIG_BANK, _BLINK_REGISTER, rate & 0x07 | 0x08)
         return None
 
+    def set_gamma(self, gamma: Optional[float] = None, brightness: float = 1.0) -> None:
+        """
+        Correct every brightness value written from now on, to make steps
+        look even to the eye and dim the whole display.  Values are looked
+        up in a 256 entry table as the frame is packed, so the correction
+        costs no float math per pixel.  Reading a pixel returns the
+        corrected value.
+
+        :param float gamma: exponent of the curve, 2.2 or so for LEDs;
+            None for a straight line
+        :param float brightness: scale of the result, 0.0->1.0
+        """
+        if gamma is not None and gamma <= 0:
+            raise ValueError("Gamma must be positive")
+        if not 0 <= brightness <= 1:
+            raise ValueError("Brightness out of range (0.0-1.0)")
+        if gamma is None and brightness == 1:
+            self._gamma = None
+            return
+        gamma = 1 if gamma is None else gamma
+        lut = bytearray(256)
+        for i in range(256):
+            lut[i] = int(255 * brightness * (i / 255) ** gamma + 0.5)
+        self._gamma = bytes(lut)
+
+    def _apply_gamma(self, data: ReadableBuffer) -> ReadableBuffer:
+        # Pass brightness values through the set_gamma() table in one go
+        lut = self._gamma
+        if lut is None:
+            return data
+        if hasattr(bytes, "translate"):
+            return bytes(data).translate(lut)
+        return bytes([lut[value] for value in data])
+
     def fill(
         self,
         color: Optional[int] = None,
@@ -347,19 +752,103 @@ class IS31FL3731:
         """
         if frame is None:
             frame = self._frame
-        self._bank(frame)
-        if color is not None:
-            if not 0 <= color <= 255:
-                raise ValueError("Color out of range")
-            data = bytearray([color] * 25)  # Extra byte at front for address.
-            with self.i2c_device as i2c:
-                for row in range(6):
-                    data[0] = _COLOR_OFFSET + row * 24
-                    i2c.write(data)
-        if blink is not None:
-            data = bool(blink) * 0xFF
-            for col in range(18):
-                self._register(frame, _BLINK_OFFSET + col, data)
+        if color is not None and not 0 <= color <= 255:
+            raise ValueError("Color out of range")
+        if color is not None and self._gamma is not None:
+            color = self._gamma[color]
+        mask = _BLINK_ALL if blink else _BLINK_NONE
+        if self._buffered or color is None:
+            if color is not None:
+                buf = self._buffer(frame)
+                for i in range(1, 145):
+                    buf[i] = color
+            if blink is not None:
+                self.set_blink_mask(mask, frame)
+            return
+        data = self._scratch
+        for i in range(19, 163):
+            data[i] = color
+        data[1:19] = mask
+        self._send_registers(data, frame, blink is not None)
+
+    def _send_registers(self, registers: bytearray, frame: int, blink: bool) -> None:
+        # Set a frame from _BLINK_OFFSET, 18 blink bytes and the 144 PWM
+        # registers.  The blink bits are only set if blink is True.  They
+        # come right before the PWM registers: send both in one write if the
+        # blink bits change, else only the PWM registers.
+        if self._buffered:
+            self._buffer(frame)[1:] = memoryview(registers)[19:]
+            if blink and self._store_blink_mask(frame, registers, 1):
+                self._update_blink(frame)
+            return
+        self._bank(frame)  # Clears the frame first under lazy_init
+        start = 19
+        if blink and self._store_blink_mask(frame, registers, 1):
+            start = 1
+        self._write_run(registers, start, 163)
+
+    def _store_blink_mask(self, frame: int, mask: ReadableBuffer, offset: int = 0) -> bool:
+        # Copy the 18 bytes of mask from offset to the blink bits of a
+        # frame, True if they changed
+        bits = self._blink_masks[frame]
+        if bits is None:
+            bits = bytearray(19)
+            bits[0] = _BLINK_OFFSET
+            self._blink_masks[frame] = bits
+        else:
+            for i in range(18):
+                if bits[1 + i] != mask[offset + i]:
+                    break
+            else:
+                return False
+        for i in range(18):
+            bits[1 + i] = mask[offset + i]
+        return True
+
+    def set_blink_mask(self, mask: ReadableBuffer, frame: Optional[int] = None) -> None:
+        """
+        Set the blink state of every LED of a frame in one write
+
+        :param mask: 18 bytes with one bit per LED, in the order of `pixel_addr`
+        :param frame: int the frame to set the mask, default the current frame
+        """
+        if len(mask) != 18:
+            raise ValueError("Blink mask must be 18 bytes")
+        if frame is None:
+            frame = self._frame
+        if self._store_blink_mask(frame, mask):
+            self._update_blink(frame)
+
+    def blink_pixels(
+        self,
+        pixels: Iterable,
+        blink: bool = True,
+        frame: Optional[int] = None,
+        rotate: int = 0,
+    ) -> None:
+        """
+        Start or stop blinking several pixels with a single write
+
+        :param pixels: iterable of (x, y) pixel positions
+        :param blink: bool True to blink, False to stop blinking
+        :param frame: int the frame to set the pixels, default the current frame
+        :param rotate: int display rotation (0, 90, 180, 270)
+        """
+        if frame is None:
+            frame = self._frame
+        bits = self._blink_mask(frame)
+        changed = False
+        for x, y in pixels:
+            pixel = self._pixel_index(x, y, rotate)
+            if pixel is None:
+                continue
+            addr, bit = pixel >> 3, pixel & 7
+            value = bits[1 + addr] | 1 << bit if blink else bits[1 + addr] & ~(1 << bit)
+            if value != bits[1 + addr]:
+                bits[1 + addr] = value
+                changed = True
+        if changed:
+            self._update_blink(frame)
 
     # This function must be replaced for each board
     @staticmethod
@@ -367,13 +856,77 @@ class IS31FL3731:
         """Calulate the offset into the device array for x,y pixel"""
         return x + y * 16
 
-    def pixel(  # noqa: PLR0913, PLR0912, Too many arguments in function definition, Too many branches
+    @classmethod
+    def _addr_table(cls, rotate: int = 0) -> bytes:
+        # LED index of every pixel of the display rotated by rotate degrees,
+        # in row-major order (as returned by img.tobytes() for rotate=0),
+        # built from pixel_addr() once per board class and rotation.
+        tables = IS31FL3731._addr_tables.get(cls)
+        if tables is None:
+            tables = IS31FL3731._addr_tables[cls] = [None] * 5
+        table = tables[rotate // 90]
+        if table is None:
+            width, height = cls.width, cls.height
+            if rotate == 0:
+                table = [cls.pixel_addr(x, y) for y in range(height) for x in range(width)]
+            elif rotate == 90:
+                table = [
+                    cls.pixel_addr(y, height - x - 1) for y in range(width) for x in range(height)
+                ]
+            elif rotate == 180:
+                table = [
+                    cls.pixel_addr(width - x - 1, height - y - 1)
+                    for y in range(height)
+                    for x in range(width)
+                ]
+            else:
+                table = [
+                    cls.pixel_addr(width - y - 1, x) for y in range(width) for x in range(height)
+                ]
+            table = tables[rotate // 90] = bytes(table)
+        return table
+
+    @classmethod
+    def _rgb_table(cls) -> bytes:
+        # LED index of every byte of packed r, g, b data on the RGB boards,
+        # where pixel_addr(column, 0), (column, 1) and (column, 2) are the
+        # channels of one LED and _rgb_columns lists the column of each LED.
+        cls._addr_table()  # Make sure the class has its list of tables
+        tables = IS31FL3731._addr_tables[cls]
+        if tables[4] is None:
+            tables[4] = bytes(
+                [cls.pixel_addr(column, c) for column in cls._rgb_columns for c in range(3)]
+            )
+        return tables[4]
+
+    def _show_rgb(self, buffer: ReadableBuffer, frame: Optional[int] = None) -> None:
+        # Shared implementation of show_rgb() on the RGB boards
+        if not isinstance(buffer, (bytes, bytearray)):
+            buffer = bytes(buffer)  # Flattens (N, 3) arrays too
+        table = self._rgb_table()
+        if len(buffer) != len(table):
+            raise ValueError(f"Buffer must be {len(table)} bytes (r, g, b for each LED)")
+        self._image_data(buffer, frame, table)
+
+    def _pixel_index(self, x: int, y: int, rotate: int = 0) -> Optional[int]:
+        # Map a rotated x,y position to its LED index, None if off the display
+        if rotate not in (0, 90, 180, 270):
+            raise ValueError("Rotation must be 0, 90, 180, or 270 degrees")
+        if rotate in (0, 180):
+            width, height = self.width, self.height
+        else:
+            width, height = self.height, self.width
+        if not (0 <= x < width and 0 <= y < height):
+            return None
+        return self._addr_table(rotate)[y * width + x]
+
+    def pixel(  # noqa: PLR0913 Too many arguments in function definition
         self,
         x: int,
         y: int,
         color: Optional[int] = None,
         frame: Optional[int] = None,
-        blink: bool = False,
+        blink: Optional[bool] = None,
         rotate: int = 0,
     ) -> Optional[int]:
         """
@@ -382,41 +935,17 @@ class IS31FL3731:
         :param x: int horizontal pixel position
         :param y: int vertical pixel position
         :param color: int brightness value 0->255
-        :param blink: bool True to blink
+        :param blink: bool True to blink, False to stop blinking, None to leave as is
         :param frame: int the frame to set the pixel, default 0
         :param rotate: int display rotation (0, 90, 180, 270)
         """
-
-        if rotate not in (0, 90, 180, 270):
-            raise ValueError("Rotation must be 0, 90, 180, or 270 degrees")
-
-        if rotate == 0:
-            check_x = 0 <= x <= self.width
-            check_y = 0 <= y <= self.height
-            if not (check_x and check_y):
-                return None
-            pixel = self.pixel_addr(x, y)
-        elif rotate == 90:
-            check_x = 0 <= y <= self.width
-            check_y = 0 <= x <= self.height
-            if not (check_x and check_y):
-                return None
-            pixel = self.pixel_addr(y, self.height - x - 1)
-        elif rotate == 180:
-            check_x = 0 <= x <= self.width
-            check_y = 0 <= y <= self.height
-            if not (check_x and check_y):
-                return None
-            pixel = self.pixel_addr(self.width - x - 1, self.height - y - 1)
-        elif rotate == 270:
-            check_x = 0 <= y <= self.width
-            check_y = 0 <= x <= self.height
-            if not (check_x and check_y):
-                return None
-            pixel = self.pixel_addr(self.width - y - 1, x)
-
+        pixel = self._pixel_index(x, y, rotate)
+        if pixel is None:
+            return None
         if color is None and blink is None:
-            return self._register(self._frame, pixel)
+            if self._buffered:
+                return self._buffer(self._frame)[1 + pixel]
+            return self._register(self._frame, _COLOR_OFFSET + pixel)
         # frames other than 0 only used in animation. allow None.
         if frame is None:
             frame = self._frame
@@ -424,37 +953,248 @@ class IS31FL3731:
         if color is not None:
             if not 0 <= color <= 255:
                 raise ValueError("Brightness or Color out of range (0-255)")
-            self._register(frame, _COLOR_OFFSET + pixel, color)
-        # Blink works but not well while animated
-        if blink:
-            addr, bit = divmod(pixel, 8)
-            bits = self._register(frame, _BLINK_OFFSET + addr)
-            if blink:
-                bits |= 1 << bit
+            if self._gamma is not None:
+                color = self._gamma[color]
+            if self._buffered:
+                self._buffer(frame)[1 + pixel] = color
             else:
-                bits &= ~(1 << bit)
-            self._register(frame, _BLINK_OFFSET + addr, bits)
+                self._register(frame, _COLOR_OFFSET + pixel, color)
+        # Blink works but not well while animated
+        if blink is not None:
+            bits = self._blink_mask(frame)
+            addr, bit = pixel >> 3, pixel & 7
+            value = bits[1 + addr] | 1 << bit if blink else bits[1 + addr] & ~(1 << bit)
+            if value != bits[1 + addr]:
+                bits[1 + addr] = value
+                self._update_blink(frame)
         return None
 
-    def image(self, img: Image, frame: Optional[int] = None, blink: bool = False) -> None:
+    def set_pixels(
+        self,
+        pixels: Iterable,
+        frame: Optional[int] = None,
+        rotate: int = 0,
+    ) -> None:
+        """
+        Set the brightness of several pixels at once.  The pixels are sorted
+        by register and sent as a few auto-increment writes rather than one
+        write per pixel.
+
+        :param pixels: iterable of (x, y, color) tuples, or a buffer of
+            consecutive x, y, color bytes
+        :param frame: int the frame to set the pixels, default the current frame
+        :param rotate: int display rotation (0, 90, 180, 270)
+        """
+        if isinstance(pixels, (bytes, bytearray, memoryview)):
+            pixels = [(pixels[i], pixels[i + 1], pixels[i + 2]) for i in range(0, len(pixels), 3)]
+        if frame is None:
+            frame = self._frame
+        values = {}
+        for x, y, color in pixels:
+            if not 0 <= color <= 255:
+                raise ValueError("Brightness or Color out of range (0-255)")
+            pixel = self._pixel_index(x, y, rotate)
+            if pixel is not None:
+                values[pixel] = color if self._gamma is None else self._gamma[color]
+        if self._buffered:
+            buf = self._buffer(frame)
+            for pixel, color in values.items():
+                buf[1 + pixel] = color
+            return
+        if not values:
+            return
+        # Send each run of consecutive registers in one write
+        buf = self._scratch
+        self._bank(frame)
+        start = end = None
+        for pixel in sorted(values):
+            buf[19 + pixel] = values[pixel]
+            if start is None:
+                start = pixel
+            elif pixel != end + 1:
+                self._write_run(buf, 19 + start, 20 + end)
+                start = pixel
+            end = pixel
+        self._write_run(buf, 19 + start, 20 + end)
+
+    def image(
+        self, img: Union[Image, ReadableBuffer], frame: Optional[int] = None, blink: bool = False
+    ) -> None:
         """Set buffer to value of Python Imaging Library image.  The image should
-        be in 8-bit mode (L) and a size equal to the display size.
+        be in 8-bit mode (L) and a size equal to the display size.  A NumPy
+        array or buffer accepted by `show_array` can be given instead.
 
         :param img: Python Imaging Library image
         :param blink: True to blink
         :param frame: the frame to set the image, default 0
         """
-        if img.mode != "L":
-            raise ValueError("Image must be in mode L.")
-        imwidth, imheight = img.size
-        if imwidth != self.width or imheight != self.height:
-            raise ValueError(
-                f"Image must be same dimensions as display ({self.width}x{self.height})."
-            )
-        # Grab all the pixels from the image, faster than getpixel.
-        pixels = img.load()
+        self._check_image(img)
+        if not hasattr(img, "mode"):
+            self.show_array(img, frame)
+        else:
+            self._image_data(img.tobytes(), frame)
+        if blink:
+            self.set_blink_mask(_BLINK_ALL, frame)
+
+    def _check_image(self, img: Union[Image, ReadableBuffer]) -> None:
+        # Raise ValueError unless image() can show img on this display
+        if hasattr(img, "mode"):
+            if img.mode != "L":
+                raise ValueError("Image must be in mode L.")
+            imwidth, imheight = img.size
+            if imwidth != self.width or imheight != self.height:
+                raise ValueError(
+                    f"Image must be same dimensions as display ({self.width}x{self.height})."
+                )
+        elif hasattr(img, "dtype"):  # A NumPy array; a memoryview is a plain buffer
+            if tuple(img.shape) != (self.height, self.width):
+                raise ValueError(f"Array must be of shape ({self.height}, {self.width})")
+        elif len(img) != self.width * self.height:
+            raise ValueError(f"Array must be {self.width * self.height} bytes")
+
+    def _image_data(
+        self,
+        data: ReadableBuffer,
+        frame: Optional[int] = None,
+        table: Optional[bytes] = None,
+    ) -> None:
+        # Set the whole display from width * height row-major brightness
+        # values, or data ordered by another address table, sent in one
+        # write unless buffered.  Registers with no LED on this board are
+        # set to 0, as show_array() does for NumPy arrays.
+        if frame is None:
+            frame = self._frame
+        if table is None:
+            table = self._addr_table()
+        if self._buffered:
+            buf, offset = self._buffer(frame), 1
+        else:
+            buf, offset = self._scratch, 19
+        if len(table) < 144:
+            for i in range(offset, offset + 144):
+                buf[i] = 0
+        self._scatter(buf, offset, data, table)
+        if not self._buffered:
+            self._bank(frame)
+            self._write_run(buf, 19, 163)
 
-        # Iterate through the pixels
-        for x in range(self.width):  # yes this double loop is slow,
-            for y in range(self.height):  #  but these displays are small!
-                self.pixel(x, y, pixels[(x, y)], blink=blink, frame=frame)
+    def _scatter(
+        self,
+        buf: bytearray,
+        offset: int,
+        data: ReadableBuffer,
+        table: Optional[bytes] = None,
+    ) -> None:
+        # Put brightness values through the set_gamma() table into buf from
+        # offset on, in register order
+        data = self._apply_gamma(data)
+        if table is None:
+            table = self._addr_table()
+        for i in range(len(table)):
+            buf[offset + table[i]] = data[i]
+
+    def _compile_registers(self, data: ReadableBuffer, blink: bool) -> bytearray:
+        # The block _send_registers() sends for row-major brightness data
+        registers = bytearray(163)
+        registers[0] = _BLINK_OFFSET
+        if blink:
+            registers[1:19] = _BLINK_ALL
+        self._scatter(registers, 19, data)
+        return registers
+
+    def _register_data(self, data: ReadableBuffer, frame: Optional[int] = None) -> None:
+        # Set the 144 PWM registers of a frame from data already in register
+        # order, sent in one write unless buffered.
+        if frame is None:
+            frame = self._frame
+        data = self._apply_gamma(data)
+        if self._buffered:
+            self._buffer(frame)[1:] = data
+            return
+        buf = self._scratch
+        buf[19:] = data
+        self._bank(frame)
+        self._write_run(buf, 19, 163)
+
+    def show_array(
+        self,
+        array: ReadableBuffer,
+        frame: Optional[int] = None,
+        scale: Optional[float] = None,
+        gamma: Optional[float] = None,
+    ) -> None:
+        """
+        Set the whole display from an array of brightness values, with no
+        PIL image needed.  NumPy arrays are mapped to the LEDs in a single
+        vectorized step.
+
+        :param array: NumPy array of shape (height, width), or any buffer of
+            width * height bytes in row-major order
+        :param frame: the frame to set, default the current frame
+        :param float scale: multiply the values by this to get 0->255;
+            default 255 for float arrays (values 0.0->1.0), else 1
+        :param float gamma: raise the scaled values, as a fraction of 255, to
+            this power
+        """
+        if hasattr(array, "dtype"):
+            self._numpy_data(array, frame, scale, gamma)
+            return
+        if not isinstance(array, (bytes, bytearray)):
+            array = bytes(array)
+        if len(array) != self.width * self.height:
+            raise ValueError(f"Array must be {self.width * self.height} bytes")
+        if scale is not None or gamma is not None:
+            scale = 1 if scale is None else scale
+            gamma = 1 if gamma is None else gamma
+            lut = [
+                min(255, int(255 * (min(255, i * scale) / 255) ** gamma + 0.5)) for i in range(256)
+            ]
+            array = bytes([lut[value] for value in array])
+        self._image_data(array, frame)
+
+    def _numpy_data(
+        self,
+        array: "numpy.ndarray",
+        frame: Optional[int],
+        scale: Optional[float],
+        gamma: Optional[float],
+    ) -> None:
+        # show_array() for NumPy arrays: convert to 0-255 and scatter to
+        # register order through the address table with array operations.
+        import numpy  # Only needed, and available, for NumPy input
+
+        array = self._numpy_values(array, scale, gamma)
+        registers = numpy.zeros(144, numpy.uint8)
+        registers[numpy.frombuffer(self._addr_table(), numpy.uint8)] = array.ravel()
+        self._register_data(registers.data, frame)
+
+    def _numpy_values(
+        self, array: "numpy.ndarray", scale: Optional[float], gamma: Optional[float]
+    ) -> "numpy.ndarray":
+        # A (height, width) NumPy array converted to uint8 brightness as
+        # described in show_array()
+        import numpy  # Only needed, and available, for NumPy input
+
+        if tuple(array.shape) != (self.height, self.width):
+            raise ValueError(f"Array must be of shape ({self.height}, {self.width})")
+        if scale is None and array.dtype.kind == "f":
+            scale = 255
+        if scale is not None or gamma is not None or array.dtype != numpy.uint8:
+            values = array.astype(numpy.float32)
+            if scale is not None:
+                values *= scale
+            numpy.clip(values, 0, 255, out=values)
+            if gamma is not None:
+                values = 255 * (values / 255) ** gamma
+            array = numpy.rint(values).astype(numpy.uint8)
+        return array
+
+    def _image_bytes(self, img: Union[Image, ReadableBuffer]) -> ReadableBuffer:
+        # Row-major 0-255 brightness of anything image() accepts, NumPy
+        # arrays converted like show_array() does
+        self._check_image(img)
+        if hasattr(img, "mode"):
+            return img.tobytes()
+        if hasattr(img, "dtype"):
+            return self._numpy_values(img, None, None).tobytes()
+        return img if isinstance(img, (bytes, bytearray)) else bytes(img)
@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3731.animator`
+====================================================
+
+Play an animation on an IS31FL3731 display at a fixed frame rate, dropping
+frames rather than slowing down when drawing and sending fall behind.
+
+.. code-block:: python
+
+    from adafruit_is31fl3731.animator import Animator
+
+    def render(number):
+        display.fill(number % 256)
+
+    animator = Animator(display, fps=30)
+    animator.run(render, frames=300)
+    print(animator.fps, animator.late_frames, animator.dropped_frames)
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+import time
+
+try:
+    from typing import Callable, Optional
+
+    from . import IS31FL3731
+    from .frame_flipper import FrameFlipper
+except ImportError:
+    pass
+
+
+class Animator:
+    """
+    Call a render function once per frame slot of ``1 / fps`` seconds and
+    send what it drew.  A frame is late when drawing and sending it overran
+    its slot.  The frames whose slots went by meanwhile are then dropped,
+    according to ``drop``:
+
+    * ``"skip"``: they are not drawn; the next frame drawn is the one due now
+    * ``"coalesce"``: they are drawn, to keep animations that build on the
+      previous frame right, but only the last one is sent
+
+    Create the display with ``buffered=True`` so coalesced frames only
+    change memory.
+
+    :param display: the IS31FL3731 display
+    :param float fps: frames per second to aim for
+    :param flipper: optional `FrameFlipper` of the display; when given each
+        frame is drawn into its back frame and flipped into view
+    :param str drop: ``"skip"`` (the default) or ``"coalesce"``
+    """
+
+    def __init__(
+        self,
+        display: IS31FL3731,
+        fps: float,
+        flipper: Optional[FrameFlipper] = None,
+        drop: str = "skip",
+    ):
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        if drop not in ("skip", "coalesce"):
+            raise ValueError("drop must be 'skip' or 'coalesce'")
+        self.display = display
+        self.flipper = flipper
+        self.drop = drop
+        self._interval = int(1_000_000_000 / fps)
+        self.frames_shown = 0
+        """Frames sent to the display by the last `run`"""
+        self.late_frames = 0
+        """Frames of the last `run` that overran their slot"""
+        self.dropped_frames = 0
+        """Frame slots of the last `run` that went by without a frame sent"""
+        self._elapsed = 0
+
+    @property
+    def fps(self) -> float:
+        """Frames per second achieved by the last `run`"""
+        if not self._elapsed:
+            return 0.0
+        return self.frames_shown * 1_000_000_000 / self._elapsed
+
+    def _send(self) -> None:
+        if self.flipper is None:
+            self.display.show()
+        else:
+            self.flipper.flip()
+
+    def run(self, render: Callable, frames: Optional[int] = None) -> None:
+        """
+        Play frames until ``render`` returns False or ``frames`` frame slots
+        have gone by.
+
+        :param render: function drawing frame ``number`` on the display,
+            called as ``render(number)`` with number counting from 0
+        :param int frames: number of frame slots to play, default no limit
+        """
+        interval = self._interval
+        self.frames_shown = self.late_frames = self.dropped_frames = 0
+        start = time.monotonic_ns()
+        number = 0
+        try:
+            while frames is None or number < frames:
+                if render(number) is False:
+                    return
+                self._send()
+                self.frames_shown += 1
+                now = time.monotonic_ns()
+                due = (now - start) // interval  # The slot we are in now
+                if due > number:
+                    self.late_frames += 1
+                if frames is not None:
+                    due = min(due, frames)
+                for missed in range(number + 1, due):
+                    self.dropped_frames += 1
+                    if self.drop == "coalesce" and render(missed) is False:
+                        return
+                number = max(number + 1, due)
+                wait = start + number * interval - time.monotonic_ns()
+                if wait > 0:
+                    time.sleep(wait / 1_000_000_000)
+        finally:
+            self._elapsed = time.monotonic_ns() - start
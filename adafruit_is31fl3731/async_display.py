@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3731.async_display`
+====================================================
+
+asyncio versions of the IS31FL3731 calls that keep the bus busy, so frame
+updates can run alongside other tasks.
+
+.. code-block:: python
+
+    import asyncio
+    from adafruit_is31fl3731.async_display import AsyncDisplay
+
+    display = Matrix(i2c, buffered=True)
+    adisplay = AsyncDisplay(display)
+
+    async def main():
+        display.fill(10)
+        await adisplay.show()
+
+    asyncio.run(main())
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+* Adafruit's asyncio library on CircuitPython:
+  https://github.com/adafruit/Adafruit_CircuitPython_asyncio
+
+"""
+
+import asyncio
+import time
+
+try:
+    from typing import Callable, Optional
+
+    from . import IS31FL3731
+    from .frame_flipper import FrameFlipper
+except ImportError:
+    pass
+
+
+class AsyncDisplay:
+    """
+    Await the bus work of a buffered IS31FL3731 display in pieces, giving
+    other tasks a turn after every write.  Drawing is done on the display
+    itself, as it only changes memory; other tasks may keep drawing while
+    `show` waits, their changes are sent by the next `show`.
+
+    :param display: the IS31FL3731 display, created with ``buffered=True``
+    :param int chunk: most data bytes sent between two turns of other
+        tasks, default 32.  Smaller chunks wait less but cost more bus time.
+    """
+
+    def __init__(self, display: IS31FL3731, chunk: Optional[int] = 32):
+        self.display = display
+        self.chunk = chunk
+
+    async def show(self, frame: Optional[int] = None) -> None:
+        """
+        Send the buffered data of a frame, see `IS31FL3731.show`
+
+        :param frame: int the frame to send, default the current frame
+        """
+        if frame is None:
+            frame = self.display.frame()
+        for _ in self.display._show_steps(frame, self.chunk):
+            await asyncio.sleep(0)
+
+    async def flip(self, flipper: FrameFlipper) -> None:
+        """Send the back frame of a `FrameFlipper` and show it, see `FrameFlipper.flip`"""
+        await self.show(flipper.back)
+        flipper.flip()  # Only the Frame Register write is left to do
+
+    async def reset(self) -> None:
+        """Kill the display for 10MS, without blocking other tasks"""
+        display = self.display
+        display._selected_bank = None
+        display.sleep(True)
+        await asyncio.sleep(0.01)  # 10 MS pause to reset.
+        display.sleep(False)
+
+    async def run(
+        self,
+        render: Callable,
+        interval: float,
+        flipper: Optional[FrameFlipper] = None,
+    ) -> None:
+        """
+        Call ``render()`` to draw the next frame every ``interval`` seconds
+        and send it, until it returns False.  Draws into the back frame of
+        ``flipper`` and flips it when given, else sends the current frame.
+
+        :param render: function drawing the next frame on the display
+        :param float interval: seconds from one frame to the next
+        :param flipper: optional `FrameFlipper` of the display
+        """
+        deadline = time.monotonic()
+        while render() is not False:
+            if flipper is None:
+                await self.show()
+            else:
+                await self.flip(flipper)
+            deadline += interval
+            await asyncio.sleep(max(0, deadline - time.monotonic()))
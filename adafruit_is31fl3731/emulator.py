@@ -0,0 +1,218 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3731.emulator`
+====================================================
+
+In-memory stand-in for an I2C bus with IS31FL3731 chips on it, to run the
+driver without hardware and count the bus traffic it causes.
+
+.. code-block:: python
+
+    from adafruit_is31fl3731.emulator import FakeI2C
+    from adafruit_is31fl3731.matrix import Matrix
+
+    i2c = FakeI2C()
+    display = Matrix(i2c)
+    i2c.clear()
+    display.fill(127)
+    print(i2c.transactions, i2c.chips[0x74].frames[0][0x24])
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from typing import Dict, List, Optional
+
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+except ImportError:
+    pass
+
+_CONFIG_BANK = 0x0B
+_BANK_ADDRESS = 0xFD
+_FRAME_SIZE = 0xB4  # Enable, blink and PWM registers of one frame
+_CONFIG_SIZE = 0x0D
+
+
+class IS31FL3731Emulator:
+    """
+    Register map of one IS31FL3731: 8 frames plus the function register bank,
+    selected through the bank address register, with auto-increment on
+    reads and writes.  Writes past the end of a bank are ignored and reads
+    past it return 0, as on the chip.
+    """
+
+    def __init__(self):
+        self.frames = [bytearray(_FRAME_SIZE) for _ in range(8)]
+        """The enable, blink and PWM registers of each frame"""
+        self.config = bytearray(_CONFIG_SIZE)
+        """The function registers"""
+        self.bank = 0
+        """The selected bank"""
+        self._pointer = 0
+
+    def _memory(self) -> bytearray:
+        if self.bank == _CONFIG_BANK:
+            return self.config
+        if not 0 <= self.bank <= 7:
+            raise OSError(5)  # EIO, no such bank
+        return self.frames[self.bank]
+
+    def write(self, data: ReadableBuffer) -> None:
+        """Handle the bytes of one write transaction sent to the chip"""
+        if not data:
+            return
+        if data[0] == _BANK_ADDRESS:
+            if len(data) > 1:
+                self.bank = data[1]
+            else:
+                self._pointer = _BANK_ADDRESS  # Reading the selected bank
+            return
+        memory = self._memory()
+        self._pointer = data[0]
+        for value in data[1:]:
+            if self._pointer < len(memory):
+                memory[self._pointer] = value
+            self._pointer += 1
+
+    def read(self, buffer: WriteableBuffer, start: int = 0, end: Optional[int] = None) -> None:
+        """Fill buffer[start:end] with the registers after the last written address"""
+        if end is None:
+            end = len(buffer)
+        if self._pointer == _BANK_ADDRESS:
+            memory = bytes([self.bank])
+            self._pointer = 0
+        else:
+            memory = self._memory()
+        for i in range(start, end):
+            buffer[i] = memory[self._pointer] if self._pointer < len(memory) else 0
+            self._pointer += 1
+
+    def pwm(self, frame: int) -> bytes:
+        """The 144 PWM registers of a frame"""
+        return bytes(self.frames[frame][0x24:_FRAME_SIZE])
+
+
+class FakeI2C:
+    """
+    Drop-in replacement for `busio.I2C` that talks to emulated chips and
+    records every transaction, to use as the ``i2c`` argument of any display
+    class.
+
+    :param dict chips: emulated chips by I2C address; default one
+        `IS31FL3731Emulator` at 0x74
+    """
+
+    def __init__(self, chips: Optional[Dict[int, IS31FL3731Emulator]] = None):
+        self.chips = chips if chips is not None else {0x74: IS31FL3731Emulator()}
+        """The emulated chips by address"""
+        self.log = []
+        """(address, bytes written, bytes read) for each transaction since `clear`"""
+        self._locked = False
+
+    def _chip(self, address: int) -> IS31FL3731Emulator:
+        try:
+            return self.chips[address]
+        except KeyError:
+            raise OSError(19) from None  # ENODEV, nothing acknowledged
+
+    def try_lock(self) -> bool:
+        """Take the bus lock, always available unless already taken"""
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self) -> None:
+        """Release the bus lock"""
+        self._locked = False
+
+    def scan(self) -> List[int]:
+        """Addresses of the emulated chips"""
+        return sorted(self.chips)
+
+    def writeto(
+        self,
+        address: int,
+        buffer: ReadableBuffer,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> None:
+        """Write buffer[start:end] to the chip at address"""
+        data = bytes(buffer[start:end])
+        chip = self._chip(address)
+        self.log.append((address, len(data), 0))
+        chip.write(data)
+
+    def readfrom_into(
+        self,
+        address: int,
+        buffer: WriteableBuffer,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> None:
+        """Read from the chip at address into buffer[start:end]"""
+        if end is None:
+            end = len(buffer)
+        chip = self._chip(address)
+        self.log.append((address, 0, end - start))
+        chip.read(buffer, start, end)
+
+    def writeto_then_readfrom(  # noqa: PLR0913 Too many arguments in function definition
+        self,
+        address: int,
+        buffer_out: ReadableBuffer,
+        buffer_in: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Write then read in a single transaction, with a repeated start"""
+        if in_end is None:
+            in_end = len(buffer_in)
+        data = bytes(buffer_out[out_start:out_end])
+        chip = self._chip(address)
+        self.log.append((address, len(data), in_end - in_start))
+        chip.write(data)
+        chip.read(buffer_in, in_start, in_end)
+
+    def deinit(self) -> None:
+        """Nothing to release, for compatibility with `busio.I2C`"""
+
+    def __enter__(self) -> "FakeI2C":
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.deinit()
+
+    @property
+    def transactions(self) -> int:
+        """Number of transactions since `clear`"""
+        return len(self.log)
+
+    @property
+    def bytes_written(self) -> int:
+        """Number of bytes written since `clear`, not counting addresses"""
+        return sum(entry[1] for entry in self.log)
+
+    @property
+    def bytes_read(self) -> int:
+        """Number of bytes read since `clear`"""
+        return sum(entry[2] for entry in self.log)
+
+    def clear(self) -> None:
+        """Forget the recorded transactions"""
+        self.log = []
@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3731.flush_scheduler`
+====================================================
+
+Send the buffered frames of IS31FL3731 displays spread over several I2C
+buses at the same time, one thread per bus.
+
+.. code-block:: python
+
+    from adafruit_is31fl3731.flush_scheduler import FlushScheduler
+
+    with FlushScheduler([left, right]) as flush:  # on two different buses
+        left.fill(10)
+        right.fill(20)
+        flush.show()
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* For use on (Linux) computers using CPython and Blinka; threads are not
+  available in CircuitPython.
+
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait
+
+try:
+    from typing import Callable, Iterable, Optional
+except ImportError:
+    pass
+
+
+class FlushScheduler:
+    """
+    Flush displays on different I2C buses in parallel from a thread pool,
+    and displays sharing a bus one after the other in the order given, so
+    refreshing a wall of displays takes as long as its busiest bus.  Create
+    the displays with ``buffered=True``.  A `TiledDisplay` can be given in
+    place of its displays.
+
+    :param Iterable displays: the IS31FL3731 displays to flush
+    :param int max_workers: most buses flushed at once, default one thread
+        per bus
+    """
+
+    def __init__(self, displays: Iterable, max_workers: Optional[int] = None):
+        self._buses = []
+        groups = {}
+        for display in self._expand(displays):
+            bus = display.i2c_device.i2c
+            if id(bus) not in groups:
+                groups[id(bus)] = []
+                self._buses.append(groups[id(bus)])
+            groups[id(bus)].append(display)
+        self._executor = None
+        if len(self._buses) > 1:
+            self._executor = ThreadPoolExecutor(max_workers or len(self._buses))
+
+    @staticmethod
+    def _expand(displays: Iterable) -> Iterable:
+        for display in displays:
+            if hasattr(display, "displays"):
+                yield from display.displays
+            else:
+                yield display
+
+    @property
+    def buses(self) -> int:
+        """Number of distinct I2C buses the displays are on"""
+        return len(self._buses)
+
+    def _run(self, action: Callable) -> None:
+        # Call action(display) for every display, one thread per bus, and
+        # wait for all of them, even when one fails, so no display is still
+        # in use on return.  The first exception raised is re-raised.
+        def run_bus(displays):
+            for display in displays:
+                action(display)
+
+        if self._executor is None:
+            for displays in self._buses:
+                run_bus(displays)
+            return
+        futures = [self._executor.submit(run_bus, displays) for displays in self._buses]
+        wait(futures)
+        for future in futures:
+            future.result()
+
+    def show(self, frame: Optional[int] = None) -> None:
+        """
+        Send the buffered data of every display, see `IS31FL3731.show`.
+        Returns once all of them are sent.
+
+        :param frame: int the frame to send, default each display's current frame
+        """
+        self._run(lambda display: display.show(frame))
+
+    def frame(self, frame: int, show: bool = True) -> None:
+        """
+        Set the current frame of every display, see `IS31FL3731.frame`
+
+        :param frame: int frame number; 0-7
+        :param show: bool True to show the frame; False to not show.
+        """
+        self._run(lambda display: display.frame(frame, show=show))
+
+    def close(self) -> None:
+        """Stop the worker threads"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "FlushScheduler":
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.close()
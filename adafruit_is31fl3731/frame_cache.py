@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3731.frame_cache`
+====================================================
+
+Keep the register data of recently shown images of an IS31FL3731 display,
+so showing one of them again is a single write with no conversion.
+
+.. code-block:: python
+
+    from adafruit_is31fl3731.frame_cache import FrameCache
+
+    cache = FrameCache(display, size=100)
+    for digit in clock_digits():
+        cache.image(digit_images[digit])
+    print(cache.hits, cache.misses, cache.evictions)
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+from collections import OrderedDict
+
+try:
+    from typing import Optional, Union
+
+    from circuitpython_typing import ReadableBuffer
+    from PIL import Image
+
+    from . import IS31FL3731
+except ImportError:
+    pass
+
+
+class FrameCache:
+    """
+    Least recently used cache of images converted for a display: blink bits
+    and brightness in register order, corrected by `IS31FL3731.set_gamma`,
+    ready to send in one write.  Images are looked up by their content, so
+    any image or buffer with the same pixels is a hit.
+
+    :param display: the IS31FL3731 display
+    :param int size: most images kept, default 64; each takes about 310
+        bytes
+    """
+
+    def __init__(self, display: IS31FL3731, size: int = 64):
+        if size < 1:
+            raise ValueError("Size must be at least 1")
+        self.display = display
+        self.size = size
+        self._frames = OrderedDict()
+        self._gamma = display._gamma
+        self.hits = 0
+        """Images found in the cache"""
+        self.misses = 0
+        """Images converted and added to the cache"""
+        self.evictions = 0
+        """Images dropped to make room for others"""
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def clear(self) -> None:
+        """Forget every image, and reset the counts"""
+        self._frames = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    def image(
+        self,
+        img: Union[Image, ReadableBuffer],
+        frame: Optional[int] = None,
+        blink: bool = False,
+    ) -> None:
+        """
+        Show an image like `IS31FL3731.image`, converting it only if it is
+        not in the cache
+
+        :param img: Python Imaging Library image, NumPy array or buffer
+            accepted by `IS31FL3731.image`
+        :param frame: the frame to set the image, default the current frame
+        :param blink: True to blink
+        """
+        display = self.display
+        data = bytes(display._image_bytes(img))
+        if display._gamma is not self._gamma:
+            # Converted with another gamma table, start over
+            self._frames = OrderedDict()
+            self._gamma = display._gamma
+        key = (data, bool(blink))
+        compiled = self._frames.pop(key, None)
+        if compiled is None:
+            self.misses += 1
+            compiled = display._compile_registers(data, blink)
+            if len(self._frames) >= self.size:
+                # The least recently used; popitem(last=False) is not in CircuitPython
+                del self._frames[next(iter(self._frames))]
+                self.evictions += 1
+        else:
+            self.hits += 1
+        self._frames[key] = compiled  # Now the most recently used
+        if frame is None:
+            frame = display.frame()
+        # Like image(), leave the blink bits alone unless blink is set
+        display._send_registers(compiled, frame, blink)
@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3731.frame_flipper`
+====================================================
+
+Tear-free animation for the IS31FL3731 charlieplex IC by drawing into a
+hidden frame and flipping it into view.
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from typing import Iterable
+
+    from . import IS31FL3731
+except ImportError:
+    pass
+
+
+class FrameFlipper:
+    """
+    Cycle an IS31FL3731 display through two or more of its 8 frames, so the
+    next picture is drawn into a hidden frame and shown with a single Frame
+    Register write.  Drawing calls without a ``frame`` argument go to the back
+    frame.  Create the display with ``buffered=True`` so each flip only sends
+    the registers that changed in the back frame.
+
+    :param display: the IS31FL3731 display to draw on
+    :param Iterable frames: the frames to cycle through; two for double
+        buffering, three for triple buffering. Defaults to (0, 1)
+    """
+
+    def __init__(self, display: IS31FL3731, frames: Iterable = (0, 1)):
+        self.display = display
+        self._frames = tuple(frames)
+        if len(self._frames) < 2:
+            raise ValueError("At least two frames are needed")
+        self._front = 0
+        display.frame(self._frames[0], show=True)
+        display.frame(self.back, show=False)
+
+    @property
+    def front(self) -> int:
+        """The frame currently shown"""
+        return self._frames[self._front]
+
+    @property
+    def back(self) -> int:
+        """The hidden frame being drawn"""
+        return self._frames[(self._front + 1) % len(self._frames)]
+
+    def flip(self) -> None:
+        """Send the back frame, show it, and start drawing into the next frame"""
+        back = self.back
+        self.display.show(back)
+        self.display.frame(back, show=True)
+        self._front = (self._front + 1) % len(self._frames)
+        self.display.frame(self.back, show=False)
@@ -30,6 +30,25 @@ Implementation Notes
 # imports
 from . import IS31FL3731
 
+_LOOKUP = (
+    (120, 88, 104),  # 0, 0
+    (136, 40, 72),  # 1, 0
+    (112, 80, 96),  # 2, 0
+    (128, 32, 64),  # 3, 0
+    (121, 89, 105),  # 0, 1
+    (137, 41, 73),  # 1, 1
+    (113, 81, 97),  # 2, 1
+    (129, 33, 65),  # 3, 1
+    (122, 90, 106),  # 0, 2
+    (138, 25, 74),  # 1, 2
+    (114, 82, 98),  # 2, 2
+    (130, 17, 66),  # 3, 2
+    (123, 91, 107),  # 0, 3
+    (139, 26, 75),  # 1, 3
+    (115, 83, 99),  # 2, 3
+    (131, 18, 67),  # 3, 3
+)
+
 
 class Keybow2040(IS31FL3731):
     """Supports the Pimoroni Keybow 2040 with 4x4 matrix of RGB LEDs"""
@@ -37,6 +56,9 @@ class Keybow2040(IS31FL3731):
     width = 16
     height = 3
 
+    # Column of pixel_addr() for each LED of show_rgb(), as in pixelrgb()
+    _rgb_columns = tuple(4 * (3 - x) + y for y in range(4) for x in range(4))
+
     def pixelrgb(  # noqa: PLR0913 Too many arguments in function definition
         self, x, y, r, g, b, blink=None, frame=None
     ):
@@ -57,25 +79,18 @@ class Keybow2040(IS31FL3731):
         super().pixel(x, 1, g, blink, frame)
         super().pixel(x, 2, b, blink, frame)
 
+    def show_rgb(self, buffer, frame=None):
+        """
+        Set every LED from packed r, g, b bytes in one write, or only in the
+        frame buffer when buffered
+
+        :param buffer: 48 bytes, r, g, b for each LED row by row from x=0, y=0; a
+            bytearray or any other buffer such as a (4, 4, 3) uint8 numpy array
+        :param frame: the frame to set the LEDs
+        """
+        self._show_rgb(buffer, frame)
+
     @staticmethod
     def pixel_addr(x, y):
-        lookup = [
-            (120, 88, 104),  # 0, 0
-            (136, 40, 72),  # 1, 0
-            (112, 80, 96),  # 2, 0
-            (128, 32, 64),  # 3, 0
-            (121, 89, 105),  # 0, 1
-            (137, 41, 73),  # 1, 1
-            (113, 81, 97),  # 2, 1
-            (129, 33, 65),  # 3, 1
-            (122, 90, 106),  # 0, 2
-            (138, 25, 74),  # 1, 2
-            (114, 82, 98),  # 2, 2
-            (130, 17, 66),  # 3, 2
-            (123, 91, 107),  # 0, 3
-            (139, 26, 75),  # 1, 3
-            (115, 83, 99),  # 2, 3
-            (131, 18, 67),  # 3, 3
-        ]
-
-        return lookup[x][y]
+        """Translate an x,y coordinate to a pixel index."""
+        return _LOOKUP[x][y]
@@ -36,8 +36,11 @@ class LedShim(IS31FL3731):
     width = 28
     height = 3
 
-    def __init__(self, i2c, address=0x75):
-        super().__init__(i2c, address)
+    # Column of pixel_addr() for each LED of show_rgb()
+    _rgb_columns = range(28)
+
+    def __init__(self, i2c, address=0x75, **kwargs):
+        super().__init__(i2c, address=address, **kwargs)
 
     def pixelrgb(  # noqa: PLR0913 Too many arguments in function definition
         self, x, r, g, b, blink=None, frame=None
@@ -56,6 +59,17 @@ class LedShim(IS31FL3731):
         super().pixel(x, 1, g, blink, frame)
         super().pixel(x, 2, b, blink, frame)
 
+    def show_rgb(self, buffer, frame=None):
+        """
+        Set every LED from packed r, g, b bytes in one write, or only in the
+        frame buffer when buffered
+
+        :param buffer: 84 bytes, r, g, b for each LED from x=0; a
+            bytearray or any other buffer such as a (28, 3) uint8 numpy array
+        :param frame: the frame to set the LEDs
+        """
+        self._show_rgb(buffer, frame)
+
     @staticmethod
     def pixel_addr(x, y):  # noqa: PLR0911, PLR0912, Too many return statements, Too many branches
         """Translate an x,y coordinate to a pixel index."""
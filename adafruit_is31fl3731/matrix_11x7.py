@@ -36,8 +36,8 @@ class Matrix11x7(IS31FL3731):
     width = 11
     height = 7
 
-    def __init__(self, i2c, address=0x75):
-        super().__init__(i2c, address)
+    def __init__(self, i2c, address=0x75, **kwargs):
+        super().__init__(i2c, address=address, **kwargs)
 
     @staticmethod
     def pixel_addr(x, y):
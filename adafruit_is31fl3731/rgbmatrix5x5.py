@@ -34,6 +34,34 @@ Implementation Notes
 # imports
 from . import IS31FL3731
 
+_LOOKUP = (
+    (118, 69, 85),
+    (117, 68, 101),
+    (116, 84, 100),
+    (115, 83, 99),
+    (114, 82, 98),
+    (132, 19, 35),
+    (133, 20, 36),
+    (134, 21, 37),
+    (112, 80, 96),
+    (113, 81, 97),
+    (131, 18, 34),
+    (130, 17, 50),
+    (129, 33, 49),
+    (128, 32, 48),
+    (127, 47, 63),
+    (125, 28, 44),
+    (124, 27, 43),
+    (123, 26, 42),
+    (122, 25, 58),
+    (121, 41, 57),
+    (126, 29, 45),
+    (15, 95, 111),
+    (8, 89, 105),
+    (9, 90, 106),
+    (10, 91, 107),
+)
+
 
 class RGBmatrix5x5(IS31FL3731):
     """Supports the Pimoroni RGBmatrix5x5 with 5x5 matrix of RGB LEDs"""
@@ -41,6 +69,9 @@ class RGBmatrix5x5(IS31FL3731):
     width = 25
     height = 3
 
+    # Column of pixel_addr() for each LED of show_rgb(), as in pixelrgb()
+    _rgb_columns = range(25)
+
     def pixelrgb(  # noqa: PLR0913 Too many arguments in function definition
         self, x, y, r, g, b, blink=None, frame=None
     ):
@@ -61,34 +92,18 @@ class RGBmatrix5x5(IS31FL3731):
         super().pixel(x, 1, g, blink, frame)
         super().pixel(x, 2, b, blink, frame)
 
+    def show_rgb(self, buffer, frame=None):
+        """
+        Set every LED from packed r, g, b bytes in one write, or only in the
+        frame buffer when buffered
+
+        :param buffer: 75 bytes, r, g, b for each LED row by row from x=0, y=0; a
+            bytearray or any other buffer such as a (5, 5, 3) uint8 numpy array
+        :param frame: the frame to set the LEDs
+        """
+        self._show_rgb(buffer, frame)
+
     @staticmethod
     def pixel_addr(x, y):
-        lookup = [
-            (118, 69, 85),
-            (117, 68, 101),
-            (116, 84, 100),
-            (115, 83, 99),
-            (114, 82, 98),
-            (132, 19, 35),
-            (133, 20, 36),
-            (134, 21, 37),
-            (112, 80, 96),
-            (113, 81, 97),
-            (131, 18, 34),
-            (130, 17, 50),
-            (129, 33, 49),
-            (128, 32, 48),
-            (127, 47, 63),
-            (125, 28, 44),
-            (124, 27, 43),
-            (123, 26, 42),
-            (122, 25, 58),
-            (121, 41, 57),
-            (126, 29, 45),
-            (15, 95, 111),
-            (8, 89, 105),
-            (9, 90, 106),
-            (10, 91, 107),
-        ]
-
-        return lookup[x][y]
+        """Translate an x,y coordinate to a pixel index."""
+        return _LOOKUP[x][y]
@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3731.stream_player`
+====================================================
+
+Play animations of any length on an IS31FL3731 display, using its 8 frames
+as a ring buffer filled ahead of the frame on show.
+
+.. code-block:: python
+
+    from adafruit_is31fl3731.stream_player import StreamPlayer
+
+    def frames():
+        for number in range(1000):
+            yield bytes([number % 256]) * (display.width * display.height)
+
+    StreamPlayer(display, fps=25).play(frames())
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+import time
+
+try:
+    from typing import Iterable, Optional
+
+    from . import IS31FL3731
+except ImportError:
+    pass
+
+
+class StreamPlayer:
+    """
+    Show frames from an iterator at a steady rate.  While one frame is on
+    show the following ones are sent to the other frames of the chip, each
+    in one write, as far ahead as there are free frames; showing the next
+    one is then a single Frame Register write on time, with no tearing.  A
+    frame is only sent when that leaves time to show the next one when due,
+    judging by how long the previous one took.  A frame that takes longer
+    than ``1 / fps`` to make still holds up the one on show: it is counted
+    in `late_frames` and the rate is kept from there on.
+
+    :param display: the IS31FL3731 display
+    :param float fps: frames per second to play at
+    :param Iterable banks: the frames of the chip to use, at least 2;
+        default all 8
+    """
+
+    def __init__(self, display: IS31FL3731, fps: float, banks: Optional[Iterable] = None):
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        self.display = display
+        self.banks = tuple(range(8) if banks is None else banks)
+        if len(self.banks) < 2:
+            raise ValueError("At least two frames are needed")
+        self._interval = int(1_000_000_000 / fps)
+        self.frames_shown = 0
+        """Frames shown by the last `play`"""
+        self.late_frames = 0
+        """Frames of the last `play` not ready in time, shown late"""
+
+    def _load(self, number: int, img) -> None:
+        bank = self.banks[number % len(self.banks)]
+        self.display.image(img, frame=bank)
+        if self.display._buffered:
+            self.display.show(bank)
+
+    def _show(self, number: int) -> None:
+        self.display.frame(self.banks[number % len(self.banks)], show=True)
+        self.frames_shown += 1
+
+    def play(self, frames: Iterable) -> None:
+        """
+        Show every frame in turn, then leave the last one on show
+
+        :param frames: iterable of images, each anything `IS31FL3731.image`
+            accepts; a generator is only asked for a frame when there is a
+            free frame of the chip to put it in
+        """
+        frames = iter(frames)
+        size = len(self.banks)
+        interval = self._interval
+        self.frames_shown = self.late_frames = 0
+        loaded = 0  # Frames sent to the chip so far
+        current = -1  # Frame on show
+        start = 0
+        load_time = 0  # How long making and sending the last frame took
+        while True:
+            due = start + (current + 1) * interval
+            now = time.monotonic_ns()
+            if current + 1 < loaded and (current < 0 or now >= due):
+                if current < 0:
+                    start = now  # The first frame sets the pace
+                elif now - due > interval // 2:
+                    # Not ready in time, keep the rate from here on
+                    self.late_frames += 1
+                    start = now - (current + 1) * interval
+                current += 1
+                self._show(current)
+            elif (
+                frames is not None
+                and loaded < current + size
+                and (current + 1 >= loaded or now + load_time < due)
+            ):
+                try:
+                    self._load(loaded, next(frames))
+                    loaded += 1
+                except StopIteration:
+                    frames = None
+                load_time = time.monotonic_ns() - now
+            elif current + 1 >= loaded:
+                return  # All shown
+            elif due > now:
+                time.sleep((due - now) / 1_000_000_000)
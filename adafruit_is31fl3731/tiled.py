@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_is31fl3731.tiled`
+====================================================
+
+Several IS31FL3731 displays of the same kind, for example CharlieBonnets at
+addresses 0x74-0x77, driven as one larger canvas.
+
+.. code-block:: python
+
+    from adafruit_is31fl3731.charlie_bonnet import CharlieBonnet
+    from adafruit_is31fl3731.tiled import TiledDisplay
+
+    tiles = [CharlieBonnet(i2c, address=a, buffered=True) for a in range(0x74, 0x78)]
+    sign = TiledDisplay(tiles, columns=2)  # 32x16
+    sign.image(img)
+    sign.show()
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from typing import Iterable, Optional
+
+    from circuitpython_typing import ReadableBuffer
+    from PIL import Image
+
+    from . import IS31FL3731
+except ImportError:
+    pass
+
+
+class TiledDisplay:
+    """
+    Present displays of the same size as a single ``width`` x ``height``
+    canvas.  The displays are laid out in rows of ``columns`` tiles, left to
+    right then top to bottom, in the order given.  Drawing calls are routed
+    to the right tile, `image` is split between all of them, and `show` and
+    `frame` go to each tile back to back.  Create the displays with
+    ``buffered=True`` so nothing reaches the bus until `show`.  Works with
+    `FrameFlipper` to flip all the tiles together.
+
+    :param Iterable displays: the IS31FL3731 displays, one per tile
+    :param int columns: tiles per row, default all in one row
+    """
+
+    def __init__(self, displays: Iterable, columns: Optional[int] = None):
+        self.displays = tuple(displays)
+        """The displays, one per tile"""
+        if not self.displays:
+            raise ValueError("At least one display is needed")
+        first = self.displays[0]
+        self.tile_width = first.width
+        self.tile_height = first.height
+        for display in self.displays:
+            if display.width != self.tile_width or display.height != self.tile_height:
+                raise ValueError("All displays must be the same size")
+        if columns is None:
+            columns = len(self.displays)
+        if not 1 <= columns <= len(self.displays) or len(self.displays) % columns:
+            raise ValueError("Displays must fill whole rows of columns tiles")
+        self.columns = columns
+        self.width = columns * self.tile_width
+        self.height = len(self.displays) // columns * self.tile_height
+        # Row-major brightness of each tile, reused by every image()
+        self._tile_data = [bytearray(self.tile_width * self.tile_height) for _ in self.displays]
+
+    def _tile(self, x: int, y: int) -> Optional[int]:
+        # Index of the tile holding canvas position x,y, None if off canvas
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        return y // self.tile_height * self.columns + x // self.tile_width
+
+    def pixel(  # noqa: PLR0913 Too many arguments in function definition
+        self,
+        x: int,
+        y: int,
+        color: Optional[int] = None,
+        frame: Optional[int] = None,
+        blink: Optional[bool] = None,
+    ) -> Optional[int]:
+        """
+        Set or read the brightness of one pixel of the canvas, see
+        `IS31FL3731.pixel`
+        """
+        tile = self._tile(x, y)
+        if tile is None:
+            return None
+        return self.displays[tile].pixel(
+            x % self.tile_width, y % self.tile_height, color, frame=frame, blink=blink
+        )
+
+    def fill(
+        self,
+        color: Optional[int] = None,
+        frame: Optional[int] = None,
+        blink: bool = False,
+    ) -> None:
+        """Fill every tile with a brightness level, see `IS31FL3731.fill`"""
+        for display in self.displays:
+            display.fill(color, frame=frame, blink=blink)
+
+    def image(self, img: Image, frame: Optional[int] = None, blink: bool = False) -> None:
+        """Set the whole canvas from a Python Imaging Library image.  The image
+        should be in 8-bit mode (L) and a size equal to the canvas size.
+
+        :param img: Python Imaging Library image
+        :param blink: True to blink
+        :param frame: the frame to set the image, default the current frame
+        """
+        if img.mode != "L":
+            raise ValueError("Image must be in mode L.")
+        imwidth, imheight = img.size
+        if imwidth != self.width or imheight != self.height:
+            raise ValueError(
+                f"Image must be same dimensions as display ({self.width}x{self.height})."
+            )
+        self._image_data(img.tobytes(), frame)
+        if blink:
+            for display in self.displays:
+                display.fill(None, frame=frame, blink=True)
+
+    def _image_data(self, data: ReadableBuffer, frame: Optional[int] = None) -> None:
+        # Split width * height row-major brightness values into the tiles
+        data = memoryview(data)
+        tile_width, tile_height = self.tile_width, self.tile_height
+        for index, display in enumerate(self.displays):
+            tile = self._tile_data[index]
+            left = index % self.columns * tile_width
+            top = index // self.columns * tile_height
+            for row in range(tile_height):
+                start = (top + row) * self.width + left
+                tile[row * tile_width : (row + 1) * tile_width] = data[start : start + tile_width]
+            display._image_data(tile, frame)
+
+    def show(self, frame: Optional[int] = None) -> None:
+        """Send the buffered data of every tile, see `IS31FL3731.show`"""
+        for display in self.displays:
+            display.show(frame)
+
+    def frame(self, frame: Optional[int] = None, show: bool = True) -> Optional[int]:
+        """
+        Set the current frame of every tile, see `IS31FL3731.frame`.  The
+        tiles switch one after the other, a register write apart.
+
+        :param frame: int frame number; 0-7 or None. If None function returns current frame
+        :param show: bool True to show the frame; False to not show.
+        """
+        if frame is None:
+            return self.displays[0].frame()
+        for display in self.displays:
+            display.frame(frame, show=show)
+        return None
+
+    def sleep(self, value: bool) -> None:
+        """Set or clear software shutdown on every tile"""
+        for display in self.displays:
+            display.sleep(value)
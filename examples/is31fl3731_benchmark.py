@@ -0,0 +1,183 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmark of the drawing operations of every display class, run against the
+emulated I2C bus so no hardware is needed.
+
+For each board and operation this counts the I2C transactions and bytes,
+measures the time spent in the driver, and estimates the operations per
+second at common bus speeds.  The time spent in the emulator is measured
+and reported separately, it is not part of the estimates.  The results are
+printed as JSON.
+
+Usage:
+python3 is31fl3731_benchmark.py [repeat]
+
+This example is for use on (Linux) computers that are using CPython.
+Pillow is optional; without it the image() benchmark is skipped.
+"""
+
+import json
+import sys
+import time
+
+from adafruit_is31fl3731.charlie_bonnet import CharlieBonnet
+from adafruit_is31fl3731.charlie_wing import CharlieWing
+from adafruit_is31fl3731.emulator import FakeI2C, IS31FL3731Emulator
+from adafruit_is31fl3731.keybow2040 import Keybow2040
+from adafruit_is31fl3731.led_shim import LedShim
+from adafruit_is31fl3731.matrix import Matrix
+from adafruit_is31fl3731.matrix_11x7 import Matrix11x7
+from adafruit_is31fl3731.rgbmatrix5x5 import RGBmatrix5x5
+from adafruit_is31fl3731.scroll_phat_hd import ScrollPhatHD
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+BOARDS = (
+    Matrix,
+    CharlieWing,
+    CharlieBonnet,
+    ScrollPhatHD,
+    Matrix11x7,
+    LedShim,
+    RGBmatrix5x5,
+    Keybow2040,
+)
+BUS_SPEEDS = (100_000, 400_000, 1_000_000)
+REPEAT = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+
+class TimedI2C(FakeI2C):
+    """FakeI2C that adds up the time spent in the emulator"""
+
+    def __init__(self, chips):
+        super().__init__(chips)
+        self.seconds = 0.0
+
+    def clear(self):
+        super().clear()
+        self.seconds = 0.0
+
+    def writeto(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            super().writeto(*args, **kwargs)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+    def readfrom_into(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            super().readfrom_into(*args, **kwargs)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+    def writeto_then_readfrom(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            super().writeto_then_readfrom(*args, **kwargs)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+
+def bus_bits(log):
+    """Clock cycles on the bus: start, address and 9 bits per byte, stop"""
+    bits = 0
+    for _, written, read in log:
+        bits += 1 + 9 + 9 * written + 1
+        if read:
+            bits += 1 + 9 + 9 * read  # Repeated start and address
+    return bits
+
+
+def measure(i2c, operation):
+    """Run operation REPEAT times, return the cost of one run"""
+    i2c.clear()
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        operation()
+    total = (time.perf_counter() - start) / REPEAT
+    emulator = i2c.seconds / REPEAT
+    host = total - emulator  # The driver alone
+    bits = bus_bits(i2c.log) / REPEAT
+    result = {
+        "transactions": i2c.transactions / REPEAT,
+        "bytes_written": i2c.bytes_written / REPEAT,
+        "bytes_read": i2c.bytes_read / REPEAT,
+        "host_seconds": host,
+        "emulator_seconds": emulator,
+        "per_second": {},
+    }
+    for speed in BUS_SPEEDS:
+        result["per_second"][str(speed)] = 1 / (host + bits / speed)
+    return result
+
+
+def new_bus():
+    return TimedI2C({0x74: IS31FL3731Emulator(), 0x75: IS31FL3731Emulator()})
+
+
+def benchmark(board):
+    i2c = new_bus()
+    results = {"init": measure(i2c, lambda: board(i2c, address=0x74))}
+    display = board(i2c, address=0x74)
+    buffered = board(i2c, address=0x75, buffered=True)
+    positions = [(x, y) for x in range(board.width) for y in range(board.height)]
+    step = [0]
+
+    def all_pixels(target):
+        step[0] += 1
+        for x, y in positions:
+            target.pixel(x, y, (x + y + step[0]) & 0xFF)
+
+    def all_pixels_show():
+        all_pixels(buffered)
+        buffered.show()
+
+    results["pixel"] = measure(i2c, lambda: all_pixels(display))
+    results["pixel_buffered"] = measure(i2c, all_pixels_show)
+    results["fill"] = measure(i2c, lambda: display.fill(step[0] & 0xFF))
+    if Image is not None:
+        img = Image.new("L", (board.width, board.height))
+        img.putdata([(i * 7) & 0xFF for i in range(board.width * board.height)])
+        results["image"] = measure(i2c, lambda: display.image(img))
+    if hasattr(board, "pixelrgb"):
+        leds = len(board._rgb_columns)
+        side = int(leds**0.5)
+
+        def all_rgb():
+            step[0] += 1
+            if board is LedShim:
+                for x in range(leds):
+                    display.pixelrgb(x, step[0] & 0xFF, 2, 3)
+            else:
+                for x in range(side):
+                    for y in range(side):
+                        display.pixelrgb(x, y, step[0] & 0xFF, 2, 3)
+
+        results["pixelrgb"] = measure(i2c, all_rgb)
+        colors = bytes(range(3 * leds))
+        results["show_rgb"] = measure(i2c, lambda: display.show_rgb(colors))
+
+    def autoplay():
+        display.autoplay(delay=110, loops=1, frames=7)
+        display.autoplay(0)
+
+    results["autoplay"] = measure(i2c, autoplay)
+    return results
+
+
+print(
+    json.dumps(
+        {
+            "repeat": REPEAT,
+            "bus_speeds": BUS_SPEEDS,
+            "boards": {board.__name__: benchmark(board) for board in BOARDS},
+        },
+        indent=2,
+    )
+)
@@ -66,6 +66,9 @@ i2c = board.I2C()  # uses board.SCL and board.SDA
 # Set up 4x4 RGB matrix of Keybow 2040
 display = Display(i2c)
 
+# Packed r, g, b bytes for all 16 keys, sent in a single write by show_rgb()
+colors = bytearray(16 * 3)
+
 step = 0
 
 while True:
@@ -79,6 +82,10 @@ while True:
 
             rgb = hsv_to_rgb(pixel_hue, 1, 1)
 
-            display.pixelrgb(x, y, int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
+            i = (y * 4 + x) * 3
+            colors[i] = int(rgb[0] * 255)
+            colors[i + 1] = int(rgb[1] * 255)
+            colors[i + 2] = int(rgb[2] * 255)
 
+    display.show_rgb(colors)
     time.sleep(0.01)
@@ -33,8 +33,11 @@ for y in range(3):
         time.sleep(0.1)
         display.pixel(x, y, 0)
 
+# Packed r, g, b bytes for all 28 LEDs, sent in a single write by show_rgb()
+colors = bytearray(28 * 3)
+
 while True:
     for offset in range(28):
         for x in range(28):
-            r, g, b = rainbow[(x + offset) % 28]
-            display.pixelrgb(x, r, g, b)
+            colors[x * 3 : x * 3 + 3] = bytes(rainbow[(x + offset) % 28])
+        display.show_rgb(colors)
@@ -47,8 +47,8 @@ if not image.is_animated:
     print("Specified image is not animated")
     sys.exit()
 
-# Get the autoplay information from the gif
-delay = image.info["duration"]
+# Get the autoplay information from the gif, the IS31FL3731 supports 11-704 ms
+delay = min(max(image.info["duration"], 11), 704)
 
 # Figure out the correct loop count
 if "loop" in image.info:
@@ -64,7 +64,8 @@ loops = min(loops, 7)
 # Get the frame count (maximum 8 frames)
 frame_count = min(image.n_frames, 8)
 
-# Load each frame of the gif onto the Matrix
+# Center each frame of the gif on the display
+frames = []
 for frame in range(frame_count):
     image.seek(frame)
     frame_image = Image.new("L", (display.width, display.height))
@@ -75,6 +76,7 @@ for frame in range(frame_count):
             display.height // 2 - image.height // 2,
         ),
     )
-    display.image(frame_image, frame=frame)
+    frames.append(frame_image)
 
-display.autoplay(delay=delay, loops=loops)
+# Send the frames to the chip, one write each, and let it play them
+display.upload_animation(frames, delay=delay, loops=loops)
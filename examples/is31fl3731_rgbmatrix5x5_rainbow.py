@@ -95,6 +95,8 @@ def test_columns(r, g, b):
 
 def test_rainbow_sweep():
     step = 0
+    # Packed r, g, b bytes for all 25 LEDs, sent in a single write by show_rgb()
+    colors = bytearray(25 * 3)
 
     for _ in range(100):
         for y in range(0, 5):
@@ -106,8 +108,12 @@ def test_rainbow_sweep():
 
                 rgb = hsv_to_rgb(pixel_hue, 1, 1)
 
-                display.pixelrgb(x, y, int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
+                i = (y * 5 + x) * 3
+                colors[i] = int(rgb[0] * 255)
+                colors[i + 1] = int(rgb[1] * 255)
+                colors[i + 2] = int(rgb[2] * 255)
 
+        display.show_rgb(colors)
         time.sleep(0.01)
         step += 3
 
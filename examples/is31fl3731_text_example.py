@@ -5,6 +5,9 @@ import adafruit_framebuf
 import board
 import busio
 
+from adafruit_is31fl3731.frame_flipper import FrameFlipper
+
+# isort: split
 # uncomment next line if you are using Feather CharlieWing LED 15 x 7
 # from adafruit_is31fl3731.charlie_wing import CharlieWing as Display
 # uncomment next line if you are using Adafruit 16x9 Charlieplexed PWM LED Matrix
@@ -22,7 +25,12 @@ from adafruit_is31fl3731.charlie_bonnet import CharlieBonnet as Display
 
 i2c = busio.I2C(board.SCL, board.SDA)
 
-display = Display(i2c)
+# buffered: drawing only updates memory, changes are sent on each flip
+display = Display(i2c, buffered=True)
+
+# to improve the display flicker we use two frames: fill the hidden
+# frame with scrolling text, then flip it into view.
+flipper = FrameFlipper(display)
 
 text_to_show = "Adafruit!!"
 
@@ -30,17 +38,11 @@ text_to_show = "Adafruit!!"
 buf = bytearray(32)  # 2 bytes tall x 16 wide = 32 bytes (9 bits is 2 bytes)
 fb = adafruit_framebuf.FrameBuffer(buf, display.width, display.height, adafruit_framebuf.MVLSB)
 
-
-frame = 0  # start with frame 0
 while True:
     for i in range(len(text_to_show) * 9):
         fb.fill(0)
         fb.text(text_to_show, -i + display.width, 0, color=1)
 
-        # to improve the display flicker we can use two frame
-        # fill the next frame with scrolling text, then
-        # show it.
-        display.frame(frame, show=False)
         # turn all LEDs off
         display.fill(0)
         for x in range(display.width):
@@ -53,5 +55,4 @@ while True:
                     display.pixel(x, y, 50)
 
         # now that the frame is filled, show it.
-        display.frame(frame, show=True)
-        frame = 0 if frame else 1
+        flipper.flip()
@@ -4,6 +4,10 @@
 import board
 import busio
 
+from adafruit_is31fl3731.animator import Animator
+from adafruit_is31fl3731.frame_flipper import FrameFlipper
+
+# isort: split
 # uncomment next line if you are using Feather CharlieWing LED 15 x 7
 from adafruit_is31fl3731.charlie_wing import CharlieWing as Display
 
@@ -26,22 +30,21 @@ sweep = [ 1, 2, 3, 4, 6, 8, 10, 15, 20, 30, 40, 60,
     60, 40, 30, 20, 15, 10, 8, 6, 4, 3, 2, 1, ]
 # fmt: on
 
-frame = 0
-
-display = Display(i2c)
-
-while True:
-    for incr in range(24):
-        # to reduce update flicker, use two frames
-        # make a frame active, don't show it yet
-        display.frame(frame, show=False)
-        # fill the display with the next frame
-        for x in range(display.width):
-            for y in range(display.height):
-                display.pixel(x, y, sweep[(x + y + incr) % 24])
-        # show the next frame
-        display.frame(frame, show=True)
-        if frame:
-            frame = 0
-        else:
-            frame = 1
+# buffered: drawing only updates memory, changes are sent on each flip
+display = Display(i2c, buffered=True)
+
+# to reduce update flicker, use two frames: draw into the hidden one
+flipper = FrameFlipper(display)
+
+
+def render(number):
+    # fill the display with the next frame
+    incr = number % 24
+    for x in range(display.width):
+        for y in range(display.height):
+            display.pixel(x, y, sweep[(x + y + incr) % 24])
+
+
+# show 30 frames per second, skipping frames if drawing can't keep up
+animator = Animator(display, fps=30, flipper=flipper)
+animator.run(render)
@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Animator with a fake clock"""
+
+import pytest
+
+from adafruit_is31fl3731 import animator
+from adafruit_is31fl3731.emulator import FakeI2C
+from adafruit_is31fl3731.matrix import Matrix
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0]
+
+    def sleep(seconds):
+        now[0] += int(seconds * 1_000_000_000)
+
+    monkeypatch.setattr(animator.time, "monotonic_ns", lambda: now[0])
+    monkeypatch.setattr(animator.time, "sleep", sleep)
+    return now
+
+
+@pytest.mark.parametrize(
+    ("drop", "drawn"),
+    [("skip", [0, 1, 2, 5, 6, 7, 8, 9]), ("coalesce", list(range(10)))],
+)
+def test_late_and_dropped_frames(clock, drop, drawn):
+    display = Matrix(FakeI2C(), buffered=True)
+    player = animator.Animator(display, fps=10, drop=drop)
+    rendered = []
+
+    def render(number):
+        rendered.append(number)
+        display.fill(number)
+        if number == 2:
+            clock[0] += 350_000_000  # Overruns into the slot of frame 5
+
+    player.run(render, frames=10)
+    assert rendered == drawn
+    assert (player.frames_shown, player.late_frames, player.dropped_frames) == (8, 1, 2)
+    assert display.i2c_device.i2c.chips[0x74].pwm(0)[0] == 9
@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""AsyncDisplay with other tasks drawing while show() waits"""
+
+import asyncio
+
+from adafruit_is31fl3731.async_display import AsyncDisplay
+from adafruit_is31fl3731.emulator import FakeI2C
+from adafruit_is31fl3731.matrix import Matrix
+
+
+def test_drawing_while_showing():
+    i2c = FakeI2C()
+    display = Matrix(i2c, buffered=True)
+    screen = AsyncDisplay(display, chunk=8)
+
+    async def draw():
+        # Runs between the chunks sent by show()
+        for i in range(20):
+            display.pixel(i % display.width, i % display.height, 100 + i)
+            display.frame(i % 2, show=False)
+            display.fill(i, frame=1)
+            await asyncio.sleep(0)
+
+    async def main():
+        display.fill(50, frame=0)
+        await asyncio.gather(screen.show(0), draw())
+        await screen.show(0)
+        await screen.show(1)
+
+    asyncio.run(main())
+    chip = i2c.chips[0x74]
+    assert chip.pwm(0) == bytes(display._buffer(0)[1:])
+    assert chip.pwm(1) == bytes(display._buffer(1)[1:])
@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""FlushScheduler on emulated buses"""
+
+import time
+
+import pytest
+
+from adafruit_is31fl3731.emulator import FakeI2C
+from adafruit_is31fl3731.flush_scheduler import FlushScheduler
+from adafruit_is31fl3731.matrix import Matrix
+
+
+def test_flushes_every_bus():
+    left = Matrix(FakeI2C(), buffered=True)
+    right = Matrix(FakeI2C(), buffered=True)
+    with FlushScheduler([left, right]) as flush:
+        assert flush.buses == 2
+        left.fill(10)
+        right.fill(20)
+        flush.show()
+    assert left.i2c_device.i2c.chips[0x74].pwm(0)[0] == 10
+    assert right.i2c_device.i2c.chips[0x74].pwm(0)[0] == 20
+
+
+def test_waits_for_every_bus_on_error():
+    failing = Matrix(FakeI2C(), buffered=True)
+    slow = Matrix(FakeI2C(), buffered=True)
+    done = []
+
+    def fail(frame=None):
+        raise OSError(5)
+
+    def show_slowly(frame=None):
+        time.sleep(0.1)
+        done.append(frame)
+
+    failing.show = fail
+    slow.show = show_slowly
+    with FlushScheduler([failing, slow]) as flush:
+        with pytest.raises(OSError):
+            flush.show()
+        assert done == [None]  # Not still running when show() raised
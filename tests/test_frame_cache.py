@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""FrameCache on the emulated bus"""
+
+import pytest
+
+from adafruit_is31fl3731.emulator import FakeI2C
+from adafruit_is31fl3731.frame_cache import FrameCache
+from adafruit_is31fl3731.matrix import Matrix
+
+
+def image(display, value):
+    return bytes([value]) * (display.width * display.height)
+
+
+@pytest.fixture(params=[False, True], ids=["unbuffered", "buffered"])
+def display(request):
+    return Matrix(FakeI2C(), buffered=request.param)
+
+
+def pwm(display, frame=0):
+    if display._buffered:
+        display.show(frame)
+    return display.i2c_device.i2c.chips[0x74].pwm(frame)
+
+
+def test_counts(display):
+    cache = FrameCache(display, size=2)
+    cache.image(image(display, 1))
+    cache.image(image(display, 2))
+    cache.image(image(display, 1))
+    assert (cache.hits, cache.misses, cache.evictions, len(cache)) == (1, 2, 0, 2)
+    assert pwm(display)[0] == 1
+    cache.clear()
+    assert (cache.hits, cache.misses, cache.evictions, len(cache)) == (0, 0, 0, 0)
+
+
+def test_least_recently_used_evicted(display):
+    cache = FrameCache(display, size=2)
+    cache.image(image(display, 1))
+    cache.image(image(display, 2))
+    cache.image(image(display, 1))  # 2 is now the least recently used
+    cache.image(image(display, 3))
+    assert cache.evictions == 1
+    cache.image(image(display, 1))
+    assert cache.hits == 2
+    cache.image(image(display, 2))
+    assert (cache.misses, cache.evictions) == (4, 2)
+    assert pwm(display)[0] == 2
+
+
+def test_gamma_change_clears(display):
+    cache = FrameCache(display)
+    cache.image(image(display, 128))
+    display.set_gamma(2.2)
+    cache.image(image(display, 128))
+    assert (cache.hits, cache.misses, len(cache)) == (0, 2, 1)
+    assert pwm(display)[0] == display._gamma[128] != 128
+
+
+def test_blink(display):
+    chip = display.i2c_device.i2c.chips[0x74]
+    cache = FrameCache(display)
+    cache.image(image(display, 5), blink=True)
+    pwm(display)
+    assert chip.frames[0][0x12:0x24] == b"\xff" * 18
+    cache.image(image(display, 6))  # Like image(), leaves the blink bits alone
+    assert pwm(display)[0] == 6
+    assert chip.frames[0][0x12:0x24] == b"\xff" * 18
+
+
+def test_numpy_converted_like_image():
+    numpy = pytest.importorskip("numpy")
+    display = Matrix(FakeI2C())
+    cache = FrameCache(display)
+    cache.image(numpy.full((display.height, display.width), 0.5))
+    assert display.pixel(0, 0) == 128
+    cache.image(numpy.full((display.height, display.width), 0.5, numpy.float32))
+    assert cache.hits == 1
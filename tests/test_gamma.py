@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""set_gamma() applied on the way to the chip"""
+
+import pytest
+from PIL import Image
+
+from adafruit_is31fl3731.emulator import FakeI2C
+from adafruit_is31fl3731.matrix import Matrix
+
+
+def corrected(value, gamma, brightness=1.0):
+    return int(255 * brightness * (value / 255) ** gamma + 0.5)
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+def test_gamma_table_applied(buffered):
+    i2c = FakeI2C()
+    display = Matrix(i2c, buffered=buffered)
+    display.set_gamma(2.2, brightness=0.5)
+    pwm = i2c.chips[0x74].pwm
+    display.fill(200)
+    display.pixel(1, 0, 100)
+    img = Image.new("L", (display.width, display.height), 150)
+    display.image(img, frame=1)
+    if buffered:
+        display.show(0)
+        display.show(1)
+    assert pwm(0)[display.pixel_addr(0, 0)] == corrected(200, 2.2, 0.5)
+    assert pwm(0)[display.pixel_addr(1, 0)] == corrected(100, 2.2, 0.5)
+    assert pwm(1)[display.pixel_addr(3, 3)] == corrected(150, 2.2, 0.5)
+    assert display.pixel(1, 0) == corrected(100, 2.2, 0.5)
+
+
+def test_gamma_off():
+    i2c = FakeI2C()
+    display = Matrix(i2c)
+    display.set_gamma(2.2)
+    display.set_gamma()
+    display.fill(100)
+    assert i2c.chips[0x74].pwm(0)[0] == 100
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""image() and show_array() with buffers and NumPy arrays"""
+
+import pytest
+
+from adafruit_is31fl3731.charlie_wing import CharlieWing
+from adafruit_is31fl3731.emulator import FakeI2C
+
+
+def test_memoryview():
+    display = CharlieWing(FakeI2C())
+    data = bytearray(range(display.width * display.height))
+    display.image(memoryview(data))
+    assert display.pixel(3, 2) == data[2 * display.width + 3]
+    display.fill(0)
+    display.show_array(memoryview(data))
+    assert display.pixel(3, 2) == data[2 * display.width + 3]
+
+
+def test_float_array_scaled():
+    numpy = pytest.importorskip("numpy")
+    display = CharlieWing(FakeI2C())
+    array = numpy.full((display.height, display.width), 0.5)
+    array[1, 2] = 2.0  # Clipped
+    display.show_array(array)
+    assert display.pixel(0, 0) == 128
+    assert display.pixel(2, 1) == 255
+    display.image(array.astype(numpy.float32))
+    assert display.pixel(0, 0) == 128
+
+
+def test_array_scale_and_gamma():
+    numpy = pytest.importorskip("numpy")
+    display = CharlieWing(FakeI2C())
+    array = numpy.full((display.height, display.width), 100, numpy.uint8)
+    display.show_array(array, scale=2)
+    assert display.pixel(0, 0) == 200
+    display.show_array(array, gamma=2)
+    assert display.pixel(0, 0) == round(255 * (100 / 255) ** 2)
+    display.show_array(bytes(array.ravel()), gamma=2)  # Same from a buffer
+    assert display.pixel(0, 0) == round(255 * (100 / 255) ** 2)
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+def test_unused_registers_cleared(buffered):
+    i2c = FakeI2C()
+    display = CharlieWing(i2c, buffered=buffered)
+    display.fill(200, frame=1)
+    display.fill(200, frame=0)
+    display.image(bytes(display.width * display.height), frame=0)
+    if buffered:
+        display.show(0)
+    assert i2c.chips[0x74].pwm(0) == bytes(144)
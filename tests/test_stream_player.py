@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""StreamPlayer with a fake clock"""
+
+import pytest
+
+from adafruit_is31fl3731 import stream_player
+from adafruit_is31fl3731.emulator import FakeI2C
+from adafruit_is31fl3731.matrix import Matrix
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0]
+
+    def sleep(seconds):
+        now[0] += int(seconds * 1_000_000_000)
+
+    monkeypatch.setattr(stream_player.time, "monotonic_ns", lambda: now[0])
+    monkeypatch.setattr(stream_player.time, "sleep", sleep)
+    return now
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+@pytest.mark.parametrize("banks", [None, (2, 5, 6)])
+def test_ring_never_overwrites_frame_on_show(clock, buffered, banks):
+    i2c = FakeI2C()
+    chip = i2c.chips[0x74]
+    display = Matrix(i2c, buffered=buffered)
+    player = stream_player.StreamPlayer(display, fps=25, banks=banks)
+    shown = []
+    image, frame = display.image, display.frame
+
+    def checked_image(img, frame=None, blink=False):
+        if player.frames_shown:
+            assert frame != chip.config[0x01]  # Frame Register: the frame on show
+        image(img, frame=frame, blink=blink)
+
+    def recorded_frame(number=None, show=True):
+        result = frame(number, show=show)
+        if number is not None and show:
+            shown.append(chip.pwm(chip.config[0x01])[0])
+        return result
+
+    display.image = checked_image
+    display.frame = recorded_frame
+    size = display.width * display.height
+
+    def frames():
+        for number in range(20):
+            clock[0] += 10_000_000  # Making a frame takes 10 ms
+            yield bytes([number]) * size
+
+    player.play(frames())
+    assert shown == list(range(20))
+    assert (player.frames_shown, player.late_frames) == (20, 0)
+
+
+def test_late_frame_counted(clock):
+    display = Matrix(FakeI2C())
+    player = stream_player.StreamPlayer(display, fps=25, banks=(0, 1))
+    size = display.width * display.height
+
+    def frames():
+        for number in range(6):
+            clock[0] += 300_000_000 if number == 3 else 1_000_000
+            yield bytes([number]) * size
+
+    player.play(frames())
+    assert (player.frames_shown, player.late_frames) == (6, 1)
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""TiledDisplay on emulated chips"""
+
+from PIL import Image
+
+from adafruit_is31fl3731.charlie_bonnet import CharlieBonnet
+from adafruit_is31fl3731.emulator import FakeI2C, IS31FL3731Emulator
+from adafruit_is31fl3731.tiled import TiledDisplay
+
+
+def make_sign():
+    i2c = FakeI2C({address: IS31FL3731Emulator() for address in range(0x74, 0x78)})
+    tiles = [CharlieBonnet(i2c, address=a, buffered=True) for a in range(0x74, 0x78)]
+    return TiledDisplay(tiles, columns=2)
+
+
+def test_image_split_matches_pixel():
+    sign = make_sign()
+    assert (sign.width, sign.height) == (32, 16)
+    img = Image.new("L", (sign.width, sign.height))
+    img.putdata([(x * 7 + y * 3) % 256 for y in range(sign.height) for x in range(sign.width)])
+    sign.image(img)
+    for y in range(sign.height):
+        for x in range(sign.width):
+            assert sign.pixel(x, y) == img.getpixel((x, y))
+
+
+def test_pixel_goes_to_its_tile():
+    sign = make_sign()
+    sign.pixel(17, 9, 42)
+    sign.show()
+    bottom_right = sign.displays[3]
+    assert bottom_right.pixel(1, 1) == 42
+    chip = bottom_right.i2c_device.i2c.chips[0x77]
+    assert chip.pwm(0)[bottom_right.pixel_addr(1, 1)] == 42
+    assert sign.displays[0].pixel(1, 1) == 0
@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Number of I2C transactions of the common operations, counted on the emulated
+bus, so a change that adds bus traffic is caught.
+"""
+
+import sys
+
+import pytest
+from PIL import Image
+
+from adafruit_is31fl3731.charlie_wing import CharlieWing
+from adafruit_is31fl3731.emulator import FakeI2C
+from adafruit_is31fl3731.matrix import Matrix
+
+
+@pytest.fixture(params=[Matrix, CharlieWing])
+def board(request):
+    return request.param
+
+
+def count(i2c, operation):
+    i2c.clear()
+    operation()
+    return i2c.transactions
+
+
+def test_init(board):
+    i2c = FakeI2C()
+    board(i2c)
+    # Device probe, shutdown, one write of the function registers, a bank
+    # switch and a write per frame, and leaving shutdown
+    assert i2c.transactions == 22
+
+
+def test_init_lazy(board):
+    i2c = FakeI2C()
+    board(i2c, lazy_init=True)
+    assert i2c.transactions == 5
+
+
+def test_init_keeps_running_chip(board):
+    i2c = FakeI2C()
+    board(i2c)
+    assert count(i2c, lambda: board(i2c, reinit=False)) == 3
+
+
+def test_fill(board):
+    i2c = FakeI2C()
+    display = board(i2c)
+    assert count(i2c, lambda: display.fill(10)) == 2  # Bank switch and one write
+    assert count(i2c, lambda: display.fill(20)) == 1  # Bank already selected
+    assert i2c.chips[0x74].pwm(0)[display.pixel_addr(0, 0)] == 20
+
+
+def test_pixel(board):
+    i2c = FakeI2C()
+    display = board(i2c)
+    display.fill(0)
+    assert count(i2c, lambda: display.pixel(1, 1, 9)) == 1
+    assert count(i2c, lambda: display.pixel(1, 1)) == 1
+    assert display.pixel(1, 1) == 9
+
+
+def test_image(board):
+    i2c = FakeI2C()
+    display = board(i2c)
+    img = Image.new("L", (display.width, display.height), 3)
+    assert count(i2c, lambda: display.image(img)) == 2  # Bank switch and one write
+    assert count(i2c, lambda: display.image(img)) == 1
+    assert i2c.chips[0x74].pwm(0)[display.pixel_addr(2, 2)] == 3
+
+
+def test_set_pixels(board):
+    i2c = FakeI2C()
+    display = board(i2c)
+    display.fill(0)
+    pixels = [(x, 0, 5) for x in range(4)]
+    # Consecutive registers on Matrix go in one write, on CharlieWing the
+    # pixels of a row are 16 registers apart
+    expected = {Matrix: 1, CharlieWing: 4}[board]
+    assert count(i2c, lambda: display.set_pixels(pixels)) == expected
+    assert [display.pixel(x, 0) for x in range(5)] == [5, 5, 5, 5, 0]
+
+
+def test_buffered_show(board):
+    i2c = FakeI2C()
+    display = board(i2c, buffered=True)
+    display.fill(3)
+    assert count(i2c, display.show) == 2  # Bank switch and one write
+    assert count(i2c, display.show) == 0  # Nothing changed
+    display.pixel(0, 0, 1)
+    assert count(i2c, display.show) == 1
+    assert i2c.chips[0x74].pwm(0)[display.pixel_addr(0, 0)] == 1
+
+
+def test_stats_match_bus(board):
+    i2c = FakeI2C()
+    display = board(i2c)
+    display.enable_stats()
+    i2c.clear()
+    display.fill(10)
+    display.pixel(0, 0, 1)
+    assert display.stats["transactions"] == i2c.transactions
+    assert display.stats["bytes_written"] == i2c.bytes_written - i2c.transactions
+
+
+def test_write_end_given(board):
+    # CircuitPython's I2CDevice.write() takes no None for end
+    i2c = FakeI2C()
+    display = board(i2c)
+    display.enable_stats()
+    write = display.i2c_device.write
+
+    def strict_write(buf, *, start=0, end=sys.maxsize):
+        assert end is not None
+        write(buf, start=start, end=end)
+
+    display.i2c_device.write = strict_write
+    display.frame(1)
+    display.fill(10)
+    display.pixel(0, 0, 1)
+    assert display.pixel(0, 0) == 1
+
+
+def test_frame_range(board):
+    display = board(FakeI2C())
+    with pytest.raises(ValueError):
+        display.frame(8, show=False)
+    assert display.frame() == 0
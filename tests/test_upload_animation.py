@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""upload_animation() on the emulated chip"""
+
+import pytest
+
+from adafruit_is31fl3731.emulator import FakeI2C
+from adafruit_is31fl3731.matrix import Matrix
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+def test_frames_and_autoplay_registers(buffered):
+    i2c = FakeI2C()
+    display = Matrix(i2c, buffered=buffered)
+    display.frame(5)
+    size = display.width * display.height
+    display.upload_animation([bytes([10 * n + 1]) * size for n in range(3)], delay=110, loops=2)
+    chip = i2c.chips[0x74]
+    for number in range(3):
+        assert chip.pwm(number) == bytes([10 * number + 1]) * 144
+    assert chip.config[0x00] == 0x08  # Autoplay mode, from frame 0
+    assert chip.config[0x02] == 2 << 4 | 3  # Loops and frames
+    assert chip.config[0x03] == 10  # Delay in steps of 11 ms
+
+
+def test_eight_frames_and_bad_input():
+    i2c = FakeI2C()
+    display = Matrix(i2c)
+    size = display.width * display.height
+    display.upload_animation([bytes([n]) * size for n in range(8)], delay=11)
+    assert i2c.chips[0x74].config[0x02] == 0  # 0 plays all 8 frames
+    i2c.clear()
+    with pytest.raises(ValueError):
+        display.upload_animation([bytes(size), bytes(size - 1)], delay=11)
+    with pytest.raises(ValueError):
+        display.upload_animation([bytes(size)] * 9, delay=11)
+    assert i2c.transactions == 0  # Nothing sent before everything is checked